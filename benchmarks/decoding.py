@@ -0,0 +1,54 @@
+"""Compare decoding time of getUpdates response with generated decoders and constructor with **kwargs.
+
+Usage: python -m benchmarks.decoding [--updates N] [--rounds N]
+"""
+import argparse
+import json
+import time
+from unittest import mock
+
+from tobe.bot.methods import BaseMethod
+from tobe.bot.services import fix_built_ins
+from tobe.bot.types import BaseType
+from tobe.bot.updates.methods import getUpdates
+
+from .fixtures import get_updates_response
+
+
+@classmethod
+def legacy_parse(cls, response, iterable=False):
+    # Parsing before generated decoders.
+    if iterable:
+        return [cls(**fix_built_ins(part)) for part in response] if response else None
+    return cls(**fix_built_ins(response)) if response else None
+
+
+def legacy_parse_response(self, content):
+    return [self.response_type[0].parse(result) for result in json.loads(content)['result']]
+
+
+def measure(name, content, count, rounds):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        getUpdates().parse_response(content)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:<10} {best / count * 1e6:8.2f} us/update')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=100)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    content = get_updates_response(args.updates)
+    with mock.patch.object(BaseType, 'parse', legacy_parse), \
+            mock.patch.object(BaseMethod, 'parse_response', legacy_parse_response):
+        measure('kwargs', content, args.updates, args.rounds)
+    measure('generated', content, args.updates, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Compare dispatch of mixed updates by probing update fields and by Router table of update kinds.
+
+Usage: python -m benchmarks.dispatch [--updates N] [--rounds N]
+"""
+import argparse
+import time
+
+from tobe.bot.router import Router
+from tobe.bot.updates.methods import getUpdates
+from tobe.bot.updates.types import UpdateKind
+
+from .fixtures import get_updates_response
+
+
+# Fields in order handlers usually probe them.
+PROBED_FIELDS = ('message', 'edited_message', 'channel_post', 'edited_channel_post', 'inline_query',
+                 'chosen_inline_result', 'callback_query', 'shipping_query', 'pre_checkout_query', 'poll',
+                 'poll_answer')
+
+
+def handle(update):
+    return update.update_id
+
+
+def probe(updates, handlers):
+    for update in updates:
+        for field in PROBED_FIELDS:
+            payload = getattr(update, field)
+            if payload is not None:
+                handlers[field](update)
+                break
+
+
+def route(updates, router):
+    dispatch = router.dispatch
+    for update in updates:
+        dispatch(update)
+
+
+def measure(name, func, updates, target, rounds):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func(updates, target)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:<8} {best / len(updates) * 1e9:8.1f} ns/update')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    updates = getUpdates().parse_response(get_updates_response(args.updates))
+    handlers = {field: handle for field in PROBED_FIELDS}
+    router = Router()
+    for kind in UpdateKind:
+        if kind:
+            router.add(kind, handle)
+
+    measure('probing', probe, updates, handlers, args.rounds)
+    measure('router', route, updates, router, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
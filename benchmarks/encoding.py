@@ -0,0 +1,70 @@
+"""Compare request body encoding with compiled type encoders and with dicts built by as_dict.
+
+Usage: python -m benchmarks.encoding [--results N] [--rounds N]
+"""
+import argparse
+import time
+
+from tobe.bot import jsonlib
+from tobe.bot.base.methods import sendMessage
+from tobe.bot.base.types import InlineKeyboardMarkup, InlineKeyboardButton
+from tobe.bot.inline.methods import answerInlineQuery
+from tobe.bot.inline.types import InlineQueryResultArticle, InputTextMessageContent
+from tobe.bot.types import BaseType
+
+
+def as_wire_dict(value):
+    # Dicts of nested types built before encoding.
+    if isinstance(value, (list, tuple)):
+        return [as_wire_dict(item) for item in value]
+    if isinstance(value, dict):
+        return {key: as_wire_dict(item) for key, item in value.items() if item is not None}
+    if isinstance(value, BaseType):
+        return {key.lstrip('_'): as_wire_dict(item) for key, item in value.as_dict().items() if item is not None}
+    return value
+
+
+def dict_body(method):
+    return jsonlib.dumpb(as_wire_dict({key: value for key, value in method.__dict__.items()
+                                       if key not in method.local_fields}))
+
+
+def keyboard_message():
+    keyboard = InlineKeyboardMarkup([[InlineKeyboardButton(f'Option {row}.{col}', callback_data=f'opt:{row}:{col}')
+                                      for col in range(3)] for row in range(4)])
+    return sendMessage(chat_id=123456789, text='Choose an option', parse_mode='HTML', reply_markup=keyboard)
+
+
+def inline_answer(count):
+    results = [InlineQueryResultArticle('article', str(num), f'Result {num}',
+                                        InputTextMessageContent(f'Text of result {num}', parse_mode='HTML'),
+                                        description=f'Description {num}')
+               for num in range(count)]
+    return answerInlineQuery('8734528734', results, cache_time=300)
+
+
+def measure(name, method, encode, rounds):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        encode(method)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:<36} {best * 1e6:9.2f} us')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--results', type=int, default=50)
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f'json backend: {jsonlib.backend}')
+    for name, method in (('sendMessage with keyboard', keyboard_message()),
+                         (f'answerInlineQuery {args.results}', inline_answer(args.results))):
+        measure(f'{name}, dicts', method, dict_body, args.rounds)
+        measure(f'{name}, compiled', method, type(method).get_method_body, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Local fake Telegram Bot API server used by benchmarks.
+
+Answers every method with canned successful response, supports keep-alive and optional tls.
+"""
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+ME = {'id': 1, 'is_bot': True, 'first_name': 'Bench', 'username': 'bench_bot'}
+
+MESSAGE = {
+    'message_id': 1,
+    'from': ME,
+    'date': 1600000000,
+    'chat': {'id': 100, 'type': 'private', 'first_name': 'User'},
+    'text': 'Hello',
+}
+
+RESULTS = {
+    'getMe': ME,
+    'sendMessage': MESSAGE,
+}
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.answer()
+
+    def do_POST(self):
+        self.answer()
+
+    def answer(self):
+        length = int(self.headers.get('content-length') or 0)
+        if length:
+            self.rfile.read(length)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        method = self.path.rsplit('/', 1)[-1]
+        result = self.server.results.get(method, True)
+        body = json.dumps({'ok': True, 'result': result}).encode()
+
+        self.send_response(200)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    """Threaded fake api server.
+
+    Parameters
+    ----------
+        latency: float
+            Seconds to sleep before every answer, simulates network round trip.
+        tls: bool
+            Serve https with self-signed certificate, requires openssl binary.
+        results: dict, optional
+            Method name -> result payload, True is returned for unknown methods.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, latency=0.0, tls=False, results=None):
+        super().__init__(('127.0.0.1', 0), FakeAPIHandler)
+        self.latency = latency
+        self.tls = tls
+        self.results = dict(RESULTS, **(results or {}))
+        if tls:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*self_signed_certificate())
+            # Handshake happens lazily in handler thread, so slow handshakes don't block accept loop.
+            self.socket = context.wrap_socket(self.socket, server_side=True, do_handshake_on_connect=False)
+        self.thread = None
+
+    @property
+    def url(self):
+        scheme = 'https' if self.tls else 'http'
+        return f'{scheme}://127.0.0.1:{self.server_address[1]}/bot'
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def self_signed_certificate():
+    directory = tempfile.mkdtemp()
+    certfile = os.path.join(directory, 'cert.pem')
+    keyfile = os.path.join(directory, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=127.0.0.1', '-keyout', keyfile, '-out', certfile],
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return certfile, keyfile
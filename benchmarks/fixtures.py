@@ -0,0 +1,89 @@
+"""Realistic getUpdates payloads shared by parsing benchmarks."""
+import copy
+import json
+
+
+USER = {'id': 123456789, 'is_bot': False, 'first_name': 'Ivan', 'last_name': 'Petrov', 'username': 'ivan_petrov',
+        'language_code': 'ru'}
+
+BOT = {'id': 987654321, 'is_bot': True, 'first_name': 'Bench', 'username': 'bench_bot'}
+
+PRIVATE_CHAT = {'id': 123456789, 'first_name': 'Ivan', 'last_name': 'Petrov', 'username': 'ivan_petrov',
+                'type': 'private'}
+
+GROUP_CHAT = {'id': -1001234567890, 'title': 'Benchmark group', 'type': 'supergroup'}
+
+PHOTO = [
+    {'file_id': 'AgACAgIAAxkBAAIBY2AAAQABc2Vz' + size, 'file_unique_id': 'AQADZ2Vz' + size,
+     'file_size': file_size, 'width': width, 'height': height}
+    for size, file_size, width, height in (('s', 1521, 90, 67), ('m', 20468, 320, 240), ('x', 82154, 800, 600))
+]
+
+TEXT_MESSAGE = {
+    'message_id': 1001,
+    'from': USER,
+    'chat': PRIVATE_CHAT,
+    'date': 1600000000,
+    'text': '/start hello @bench_bot, see https://example.com for details',
+    'entities': [
+        {'offset': 0, 'length': 6, 'type': 'bot_command'},
+        {'offset': 13, 'length': 10, 'type': 'mention'},
+        {'offset': 29, 'length': 19, 'type': 'url'},
+    ],
+}
+
+PHOTO_MESSAGE = {
+    'message_id': 1002,
+    'from': USER,
+    'chat': GROUP_CHAT,
+    'date': 1600000010,
+    'photo': PHOTO,
+    'caption': 'Look at this',
+    'reply_to_message': {
+        'message_id': 1000,
+        'from': BOT,
+        'chat': GROUP_CHAT,
+        'date': 1599999990,
+        'text': 'Send me a photo',
+    },
+}
+
+CALLBACK_QUERY = {
+    'id': '4382bfdwdsb323b2d9',
+    'from': USER,
+    'message': {
+        'message_id': 1003,
+        'from': BOT,
+        'chat': PRIVATE_CHAT,
+        'date': 1600000020,
+        'text': 'Choose option',
+        'reply_markup': {'inline_keyboard': [[{'text': 'Yes', 'callback_data': 'yes'},
+                                              {'text': 'No', 'callback_data': 'no'}]]},
+    },
+    'chat_instance': '-8734527342',
+    'data': 'yes',
+}
+
+INLINE_QUERY = {'id': '8734528734', 'from': USER, 'query': 'cats', 'offset': ''}
+
+
+def updates(count=100, start=1):
+    """List of raw updates, mix of text, photo, callback and inline updates."""
+    kinds = (
+        ('message', TEXT_MESSAGE),
+        ('message', PHOTO_MESSAGE),
+        ('callback_query', CALLBACK_QUERY),
+        ('message', TEXT_MESSAGE),
+        ('edited_message', TEXT_MESSAGE),
+        ('inline_query', INLINE_QUERY),
+    )
+    result = []
+    for num in range(count):
+        kind, payload = kinds[num % len(kinds)]
+        result.append({'update_id': start + num, kind: copy.deepcopy(payload)})
+    return result
+
+
+def get_updates_response(count=100, start=1):
+    """Body of getUpdates response as bytes."""
+    return json.dumps({'ok': True, 'result': updates(count, start)}).encode()
@@ -0,0 +1,62 @@
+"""Compare installed json backends on large getUpdates responses and request bodies.
+
+Usage: python -m benchmarks.json_backends [--updates N] [--text-size N] [--rounds N]
+"""
+import argparse
+import json
+import time
+
+from tobe.bot import jsonlib
+from tobe.bot.base.methods import sendMessage
+from tobe.bot.updates.methods import getUpdates
+
+from .encoding import keyboard_message
+from .fixtures import updates
+
+
+def large_response(count, text_size):
+    # Long texts with non ascii characters, as in busy group chats.
+    result = updates(count)
+    for update in result:
+        message = update.get('message') or update.get('edited_message')
+        if message is not None and 'text' in message:
+            message['text'] = ('Привет, мир! Hello, world! ' * text_size)[:text_size]
+    return json.dumps({'ok': True, 'result': result}, ensure_ascii=False).encode()
+
+
+def best_of(rounds, func):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=100)
+    parser.add_argument('--text-size', type=int, default=4096)
+    parser.add_argument('--rounds', type=int, default=100)
+    args = parser.parse_args()
+
+    content = large_response(args.updates, args.text_size)
+    # Request bodies are built by get_method_body, as they are sent.
+    method = sendMessage(chat_id=123456789, text='Привет, мир! ' * 100).set_token('123:token')
+    keyboard = keyboard_message().set_token('123:token')
+    print(f'getUpdates response: {len(content) / 1024:.0f} KiB, {args.updates} updates')
+    print(f'{"backend":<8} {"loads":>12} {"parse":>12} {"body":>12} {"keyboard":>12}')
+    for name in jsonlib.available():
+        jsonlib.use(name)
+        loads = best_of(args.rounds, lambda: jsonlib.loads(content))
+        parse = best_of(args.rounds, lambda: getUpdates().parse_response(content))
+        body = best_of(args.rounds, method.get_method_body)
+        keyboard_body = best_of(args.rounds, keyboard.get_method_body)
+        print(f'{name:<8} {loads * 1e3:9.3f} ms {parse * 1e3:9.3f} ms {body * 1e6:9.2f} us '
+              f'{keyboard_body * 1e6:9.2f} us')
+    jsonlib.use()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Measure memory retained by parsed updates with tracemalloc.
+
+Usage: python -m benchmarks.memory [--updates N] [--lazy] [--identity]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from tobe.bot.identity import IdentityMap
+from tobe.bot.updates.methods import getUpdates
+
+from .fixtures import get_updates_response
+
+
+def retained_bytes(content, lazy=False, identity_map=None):
+    """Bytes allocated by parsing getUpdates response and still held by parsed updates."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    updates = getUpdates(lazy=lazy, identity_map=identity_map).parse_response(content)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return updates, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=1000)
+    parser.add_argument('--lazy', action='store_true', help='Parse LazyUpdate objects.')
+    parser.add_argument('--identity', action='store_true', help='Share users and chats with IdentityMap.')
+    args = parser.parse_args()
+
+    content = get_updates_response(args.updates)
+    identity_map = IdentityMap() if args.identity else None
+    # Decoders are generated before measurement.
+    getUpdates(lazy=args.lazy, identity_map=identity_map).parse_response(get_updates_response(6))
+    if identity_map is not None:
+        identity_map.clear()
+    updates, size = retained_bytes(content, args.lazy, identity_map)
+    print(f'updates        {len(updates):10d}')
+    print(f'retained bytes {size:10d}')
+    print(f'bytes/update   {size / len(updates):10.1f}')
+    if identity_map is not None:
+        print(f'shared         {identity_map.hits:10d}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Compare parsing time of getUpdates response with eager and lazy updates.
+
+Usage: python -m benchmarks.parsing [--updates N] [--rounds N]
+"""
+import argparse
+import time
+
+from tobe.bot.updates.methods import getUpdates
+
+from .fixtures import get_updates_response
+
+
+def touch_nothing(updates):
+    pass
+
+
+def touch_text(updates):
+    # Typical handler which looks only at message text.
+    for update in updates:
+        message = update.message
+        if message is not None:
+            message.text
+
+
+def touch_all(updates):
+    def walk(value):
+        if isinstance(value, list):
+            for item in value:
+                walk(item)
+        elif hasattr(value, 'as_dict'):
+            for item in value.as_dict().values():
+                walk(item)
+
+    walk(updates)
+
+
+def measure(name, lazy, consume, content, count, rounds):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        consume(getUpdates(lazy=lazy).parse_response(content))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:<22} {best / count * 1e6:8.2f} us/update')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=100)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    content = get_updates_response(args.updates)
+    for consume in (touch_nothing, touch_text, touch_all):
+        for lazy in (False, True):
+            name = f'{"lazy" if lazy else "eager"} {consume.__name__}'
+            measure(name, lazy, consume, content, args.updates, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
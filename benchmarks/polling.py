@@ -0,0 +1,45 @@
+"""Compare long polling throughput with offset committed before (pipelined) and after processing of batch.
+
+Usage: python -m benchmarks.polling [--updates N] [--limit N] [--latency SECONDS] [--work SECONDS]
+"""
+import argparse
+import time
+
+from tobe.bot.bot import Bot
+from tobe.bot.transports import FakeTransport
+
+from .fixtures import updates
+
+
+def run(commit, total, limit, latency, work):
+    def get_updates(params):
+        offset = params.get('offset') or 1
+        return updates(max(0, min(limit, total - offset + 1)), offset)
+
+    bot = Bot('123:token', transport=FakeTransport({'getUpdates': get_updates}, latency=latency))
+    poller = bot.iter_updates(limit=limit, timeout=0, commit=commit)
+    started = time.perf_counter()
+    for update in poller:
+        # Handler which waits for io, like database or api request.
+        time.sleep(work)
+        if update.update_id == total:
+            break
+    poller.close()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=1000)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.1, help='Seconds of getUpdates round trip.')
+    parser.add_argument('--work', type=float, default=0.001, help='Seconds of handling of one update.')
+    args = parser.parse_args()
+
+    for commit in ('after', 'before'):
+        elapsed = run(commit, args.updates, args.limit, args.latency, args.work)
+        print(f'commit {commit:<6} {elapsed:6.2f} s, {args.updates / elapsed:8.1f} updates/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compare requests/second of per-call httplib2.Http with Bot owned connection pool.
+
+Usage: python -m benchmarks.pool [--requests N] [--tls]
+"""
+import argparse
+import time
+
+import httplib2
+
+from tobe.bot.bot import Bot
+from tobe.bot.methods import BaseMethod
+from tobe.bot.base.methods import getMe
+from tobe.bot.pool import ConnectionPool
+from tobe.bot.transports import Httplib2Transport
+
+from .fake_api import FakeAPIServer
+
+
+def per_call(requests, tls):
+    # Same as BaseMethod.execute without pool, but certificate validation must be off for self-signed cert.
+    for _ in range(requests):
+        method = getMe().set_token('token')
+        http = httplib2.Http(disable_ssl_certificate_validation=tls)
+        resp, content = http.request(method.get_method_url(), method=method.http_method,
+                                     body=method.get_method_body(), headers={'content-type': method.content_type})
+        method.parse_response(content)
+
+
+def pooled(requests, tls):
+    pool = ConnectionPool(factory=lambda: httplib2.Http(disable_ssl_certificate_validation=tls))
+    bot = Bot('token', transport=Httplib2Transport(pool))
+    for _ in range(requests):
+        bot.execute(getMe())
+    bot.close()
+
+
+def measure(name, func, requests, tls):
+    started = time.perf_counter()
+    func(requests, tls)
+    elapsed = time.perf_counter() - started
+    print(f'{name:<10} {requests / elapsed:10.1f} req/s')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--tls', action='store_true')
+    args = parser.parse_args()
+
+    with FakeAPIServer(tls=args.tls) as server:
+        BaseMethod.request_url = server.url
+        measure('per-call', per_call, args.requests, args.tls)
+        measure('pooled', pooled, args.requests, args.tls)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Compare getUpdates parsed into list and into ResponseStream: time to first update, total time and peak memory.
+
+Usage: python -m benchmarks.streaming [--updates N] [--text-size N] [--rounds N]
+"""
+import argparse
+import time
+import tracemalloc
+
+from tobe.bot.updates.methods import getUpdates
+
+from .json_backends import large_response
+
+
+def handle(update):
+    # Handler which reads message text.
+    message = update.message
+    if message is not None:
+        message.text
+
+
+def run(stream, content):
+    started = time.perf_counter()
+    first = None
+    for update in getUpdates(stream=stream).parse_response(content):
+        if first is None:
+            first = time.perf_counter() - started
+        handle(update)
+    return first, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=100)
+    parser.add_argument('--text-size', type=int, default=4096)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    content = large_response(args.updates, args.text_size)
+    print(f'getUpdates response: {len(content) / 1024:.0f} KiB, {args.updates} updates')
+    for stream in (False, True):
+        first, total = map(min, zip(*(run(stream, content) for _ in range(args.rounds))))
+        tracemalloc.start()
+        run(stream, content)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{"stream" if stream else "list":<7} first update {first * 1e3:7.3f} ms, '
+              f'all {total * 1e3:7.3f} ms, peak {peak / 1024:7.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Compare per chat serialization of broadcast method: encoding whole body and MethodTemplate.
+
+Usage: python -m benchmarks.templates [--chats N]
+"""
+import argparse
+import copy
+import time
+
+from tobe.bot.base.methods import sendMessage
+from tobe.bot.templates import MethodTemplate
+
+from .encoding import keyboard_message
+
+
+def encode_copies(method, chat_ids):
+    for chat_id in chat_ids:
+        copied = copy.copy(method)
+        copied.chat_id = chat_id
+        copied.get_method_body()
+
+
+def encode_template(method, chat_ids):
+    template = MethodTemplate(method)
+    for chat_id in chat_ids:
+        template.bind(chat_id=chat_id).get_method_body()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--chats', type=int, default=100000)
+    args = parser.parse_args()
+
+    chat_ids = range(100000000, 100000000 + args.chats)
+    for name, method in (('sendMessage', sendMessage(chat_id=None, text='News of the week ' * 20)),
+                         ('sendMessage with keyboard', keyboard_message())):
+        for encode in (encode_copies, encode_template):
+            started = time.perf_counter()
+            encode(method, chat_ids)
+            elapsed = time.perf_counter() - started
+            print(f'{name:<26} {encode.__name__:<16} {elapsed / args.chats * 1e6:7.2f} us/chat')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Shared benchmark harness for all transports.
+
+Every backend executes same workload against local fake api server (in-memory fake answers without network):
+sequential getMe calls (latency) and concurrent sendMessage batches (throughput).
+
+Usage: python -m benchmarks.transports [--requests N] [--concurrency N] [--tls]
+"""
+import argparse
+import asyncio
+import ssl
+import statistics
+import time
+
+import httplib2
+
+from tobe.bot.bot import Bot, AsyncBot
+from tobe.bot.methods import BaseMethod
+from tobe.bot.base.methods import getMe, sendMessage
+from tobe.bot.pool import ConnectionPool
+from tobe.bot.aio import AsyncHTTPClient
+from tobe.bot.transports import Httplib2Transport, HTTPClientTransport, FakeTransport, AsyncFakeTransport
+
+from .fake_api import FakeAPIServer
+
+
+def sync_backends(tls, concurrency):
+    context = ssl._create_unverified_context()
+    return {
+        'httplib2': lambda: Httplib2Transport(ConnectionPool(
+            max_size=concurrency, max_idle=concurrency,
+            factory=lambda: httplib2.Http(disable_ssl_certificate_validation=tls))),
+        'http.client': lambda: HTTPClientTransport(ssl_context=context, max_size=concurrency, max_idle=concurrency),
+        'fake': lambda: FakeTransport(),
+    }
+
+
+def async_backends(tls, concurrency):
+    context = ssl._create_unverified_context()
+    return {
+        'asyncio': lambda: AsyncHTTPClient(max_size=concurrency, ssl_context=context),
+        'async fake': lambda: AsyncFakeTransport(),
+    }
+
+
+def report(name, latencies, requests, elapsed):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f'{name:<12} p50 {p50:7.3f} ms  p99 {p99:7.3f} ms  {requests / elapsed:10.1f} req/s')
+
+
+def run_sync(name, transport, requests, concurrency):
+    bot = Bot('token', transport=transport)
+    bot.execute(getMe())
+
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        bot.execute(getMe())
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    bot.execute([sendMessage(chat_id, 'Hello') for chat_id in range(requests)], concurrency=concurrency)
+    report(name, latencies, requests, time.perf_counter() - started)
+    bot.close()
+
+
+async def run_async(name, transport, requests, concurrency):
+    bot = AsyncBot('token', transport=transport)
+    await bot.execute(getMe())
+
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await bot.execute(getMe())
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await bot.execute_many([sendMessage(chat_id, 'Hello') for chat_id in range(requests)], concurrency=concurrency)
+    report(name, latencies, requests, time.perf_counter() - started)
+    await bot.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--tls', action='store_true')
+    args = parser.parse_args()
+
+    with FakeAPIServer(tls=args.tls) as server:
+        BaseMethod.request_url = server.url
+        print(f'{args.requests} requests, concurrency {args.concurrency}, tls {args.tls}')
+        for name, factory in sync_backends(args.tls, args.concurrency).items():
+            run_sync(name, factory(), args.requests, args.concurrency)
+        for name, factory in async_backends(args.tls, args.concurrency).items():
+            asyncio.run(run_async(name, factory(), args.requests, args.concurrency))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Throughput of webhook server with concurrent keep-alive connections, like deliveries of telegram.
+
+Usage: python -m benchmarks.webhook [--updates N] [--connections N] [--work SECONDS]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from tobe.bot.webhook import WebhookServer
+
+from .fixtures import updates
+
+
+async def deliver(port, path, bodies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for body in bodies:
+        writer.write(b'POST %s HTTP/1.1\r\nHost: bot\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s'
+                     % (path.encode(), len(body), body))
+        head = await reader.readuntil(b'\r\n\r\n')
+        length = int(head.lower().split(b'content-length:', 1)[1].split(b'\r\n', 1)[0])
+        await reader.readexactly(length)
+    writer.close()
+
+
+async def run(total, connections, work):
+    async def handler(update):
+        # Handler which waits for io, like database or api request.
+        await asyncio.sleep(work)
+
+    bodies = [json.dumps(update).encode() for update in updates(total)]
+    async with WebhookServer(handler, host='127.0.0.1', port=0, max_connections=connections) as server:
+        port = server.sockets[0].getsockname()[1]
+        started = time.perf_counter()
+        await asyncio.gather(*(deliver(port, server.path, bodies[i::connections]) for i in range(connections)))
+        return time.perf_counter() - started, server.stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=20000)
+    parser.add_argument('--connections', type=int, default=40, help='max_connections of webhook.')
+    parser.add_argument('--work', type=float, default=0.0, help='Seconds of handling of one update.')
+    args = parser.parse_args()
+
+    elapsed, stats = asyncio.run(run(args.updates, args.connections, args.work))
+    print(f'{args.connections} connections {elapsed:6.2f} s, {args.updates / elapsed:8.1f} updates/s, '
+          f'{elapsed / args.updates * 1e6:6.1f} us per update, max in flight {stats.max_in_flight}')
+
+
+if __name__ == '__main__':
+    main()
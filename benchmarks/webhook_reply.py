@@ -0,0 +1,75 @@
+"""Compare webhook handler which sends reply with separate request and which returns it in response.
+
+Time is measured from delivery of update until telegram has both reply and webhook response,
+then delivery of next update can start. Network round trip between server and telegram is simulated.
+
+Usage: python -m benchmarks.webhook_reply [--updates N] [--latency SECONDS]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from tobe.bot.base.methods import sendMessage
+from tobe.bot.bot import AsyncBot
+from tobe.bot.transports import AsyncFakeTransport
+from tobe.bot.webhook import WebhookServer
+
+from .fake_api import MESSAGE
+from .fixtures import updates
+
+
+async def run(mode, total, latency):
+    received = {}
+
+    def send_message(params):
+        # Telegram receives request half a round trip after it's sent.
+        received[params['reply_to_message_id']] = time.perf_counter() - latency / 2
+        return MESSAGE
+
+    transport = AsyncFakeTransport({'sendMessage': send_message}, latency=latency)
+    bot = AsyncBot('123:token', transport=transport)
+
+    async def handler(update):
+        method = sendMessage(update.chat_id, 'Hello', reply_to_message_id=update.update_id)
+        if mode == 'response':
+            return method
+        await bot.execute(method)
+
+    elapsed = 0.0
+    async with WebhookServer(handler, host='127.0.0.1', port=0, bot=bot) as server:
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.sockets[0].getsockname()[1])
+        for update in updates(total):
+            body = json.dumps(update).encode()
+            started = time.perf_counter()
+            # Update travels from telegram to server half a round trip.
+            await asyncio.sleep(latency / 2)
+            writer.write(b'POST %s HTTP/1.1\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s'
+                         % (server.path.encode(), len(body), body))
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = int(head.lower().split(b'content-length:', 1)[1].split(b'\r\n', 1)[0])
+            reply = await reader.readexactly(length)
+            # Response travels to telegram half a round trip too.
+            await asyncio.sleep(latency / 2)
+            responded = time.perf_counter()
+            if reply:
+                received[update['update_id']] = responded
+            elapsed += max(received[update['update_id']], responded) - started
+        writer.close()
+    await bot.close()
+    return elapsed / total, len(transport.requests)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds of api round trip.')
+    args = parser.parse_args()
+
+    for mode in ('request', 'response'):
+        latency, requests = asyncio.run(run(mode, args.updates, args.latency))
+        print(f'reply in {mode:<8} {latency * 1000:7.2f} ms per update, {requests} api requests')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+import asyncio
+import http.client
+import ssl
+import time
+from collections import defaultdict, deque
+from urllib.parse import urlsplit
+
+from .multipart import MultipartEncoder
+from .transports import AsyncTransport, StaleConnection
+
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class AsyncConnection:
+    """Keep-alive connection over asyncio streams."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.created_at = time.monotonic()
+        self.used_at = self.created_at
+
+    @property
+    def age(self):
+        return time.monotonic() - self.created_at
+
+    @property
+    def idle(self):
+        return time.monotonic() - self.used_at
+
+    def is_alive(self):
+        return not self.reader.at_eof() and not self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncHTTPClient(AsyncTransport):
+    """Minimal non-blocking HTTP/1.1 client over asyncio streams with per host pool of keep-alive connections.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of requests in flight, other requests wait for free slot.
+    max_idle : int
+        Maximum number of idle connections kept open per host.
+    max_age : float
+        Maximum connection age in seconds.
+    max_idle_time : float
+        Idle connections unused for longer than this number of seconds are closed on checkout.
+    timeout : float, optional
+        Seconds to wait for whole request, wait forever if None.
+    ssl_context : ssl.SSLContext, optional
+        Context for https connections, default context is used if not provided.
+    """
+
+    def __init__(self, max_size=100,
+                 max_idle=100,
+                 max_age=300.0,
+                 max_idle_time=60.0,
+                 timeout=None,
+                 ssl_context=None):
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self.max_idle_time = max_idle_time
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+
+        self._idle = defaultdict(deque)
+        self._slots = None
+
+        self.created = 0
+        self.reused = 0
+
+    async def request(self, method, url, body=None, headers=None):
+        """Send request and read whole response.
+
+        Returns
+        -------
+            Tuple (status, content), where content is bytes.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+        async with self._slots:
+            if self.timeout is None:
+                return await self._request(method, url, body, headers)
+            return await asyncio.wait_for(self._request(method, url, body, headers), self.timeout)
+
+    async def _request(self, method, url, body, headers):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port or DEFAULT_PORTS[parts.scheme])
+        payload = self.build_request(method, parts, body, headers)
+
+        while True:
+            conn, reused = await self._acquire(key)
+            try:
+                try:
+                    conn.writer.write(payload)
+                    if isinstance(body, MultipartEncoder):
+                        await body.write_to_stream(conn.writer)
+                    else:
+                        await conn.writer.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    if reused:
+                        raise StaleConnection
+                    raise
+                try:
+                    status, keep_alive, content = await read_response(conn.reader)
+                except http.client.RemoteDisconnected:
+                    if reused:
+                        raise StaleConnection
+                    raise
+            except StaleConnection:
+                # Server closed idle keep-alive connection before reading request, repeat on fresh connection.
+                # Other errors (like timeout) are not repeated, request may be received already.
+                conn.close()
+                continue
+            except BaseException:
+                conn.close()
+                raise
+
+            if keep_alive:
+                self._release(key, conn)
+            else:
+                conn.close()
+            return status, content
+
+    def build_request(self, method, parts, body, headers):
+        """Build request head with body, multipart body is not included and must be streamed after head."""
+        if isinstance(body, MultipartEncoder):
+            content_length, body = len(body), b''
+        else:
+            body = (body.encode() if isinstance(body, str) else body) or b''
+            content_length = len(body)
+        path = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+        lines = [f'{method} {path} HTTP/1.1', f'host: {parts.netloc}', 'connection: keep-alive',
+                 f'content-length: {content_length}']
+        for name, value in (headers or {}).items():
+            if name.lower() != 'content-length':
+                lines.append(f'{name}: {value}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    async def _acquire(self, key):
+        idle = self._idle[key]
+        while idle:
+            conn = idle.pop()
+            if conn.is_alive() and conn.age < self.max_age and conn.idle < self.max_idle_time:
+                self.reused += 1
+                return conn, True
+            conn.close()
+
+        scheme, host, port = key
+        context = None
+        if scheme == 'https':
+            context = self.ssl_context or ssl.create_default_context()
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        self.created += 1
+        return AsyncConnection(reader, writer), False
+
+    def _release(self, key, conn):
+        conn.used_at = time.monotonic()
+        idle = self._idle[key]
+        if len(idle) < self.max_idle and conn.age < self.max_age:
+            idle.append(conn)
+        else:
+            conn.close()
+
+    async def close(self):
+        """Close all idle connections."""
+        idle, self._idle = self._idle, defaultdict(deque)
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+
+async def read_response(reader):
+    """Read http response from stream.
+
+    Returns
+    -------
+        Tuple (status, keep_alive, content).
+    """
+    try:
+        status_line = await reader.readuntil(b'\r\n')
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise
+        # Same as http.client: connection is closed without any byte of response.
+        raise http.client.RemoteDisconnected('Remote end closed connection without response')
+    version, status = status_line.split(b' ', 2)[:2]
+    headers = await read_headers(reader)
+
+    keep_alive = headers.get('connection', '').lower() != 'close' and version != b'HTTP/1.0'
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        content = await read_chunked(reader)
+    elif 'content-length' in headers:
+        content = await reader.readexactly(int(headers['content-length']))
+    else:
+        content = await reader.read()
+        keep_alive = False
+    return int(status), keep_alive, content
+
+
+async def read_headers(reader):
+    headers = {}
+    while True:
+        line = await reader.readuntil(b'\r\n')
+        if line == b'\r\n':
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+async def read_chunked(reader):
+    chunks = []
+    while True:
+        size_line = await reader.readuntil(b'\r\n')
+        size = int(size_line.split(b';', 1)[0], 16)
+        if not size:
+            # Skip trailers.
+            await read_headers(reader)
+            return b''.join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
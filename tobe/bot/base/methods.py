@@ -1,10 +1,14 @@
 from ..methods import BaseMethod
-from .types import User, Message, InlineKeyboardMarkup
+from ..priority import Priority
+from .types import User, Message, InlineKeyboardMarkup, File, Chat, ChatMember, UserProfilePhotos
 
 
 class getMe(BaseMethod):
     response_type = User
 
+    cache_ttl = 3600
+    read_only = True
+
     def __init__(self):
         super().__init__()
 
@@ -258,6 +262,8 @@ class sendVideo(BaseMethod):
          Additional interface options. A JSON-serialized object for an inline keyboard, custom reply keyboard, instructions to remove reply keyboard or to force a reply from the user.
     """
 
+    response_type = Message
+
     def __init__(self, chat_id,
                  video,
                  duration=None,
@@ -316,6 +322,8 @@ class sendAnimation(BaseMethod):
          Additional interface options. A JSON-serialized object for an inline keyboard, custom reply keyboard, instructions to remove reply keyboard or to force a reply from the user.
     """
 
+    response_type = Message
+
     def __init__(self, chat_id,
                  animation,
                  duration=None,
@@ -366,6 +374,8 @@ class sendVoice(BaseMethod):
          Additional interface options. A JSON-serialized object for an inline keyboard, custom reply keyboard, instructions to remove reply keyboard or to force a reply from the user.
     """
 
+    response_type = Message
+
     def __init__(self, chat_id,
                  voice,
                  caption=None,
@@ -410,6 +420,8 @@ class sendVideoNote(BaseMethod):
          Additional interface options. A JSON-serialized object for an inline keyboard, custom reply keyboard, instructions to remove reply keyboard or to force a reply from the user.
     """
 
+    response_type = Message
+
     def __init__(self, chat_id,
                  video_note,
                  duration=None,
@@ -797,6 +809,10 @@ class getUserProfilePhotos(BaseMethod):
          Limits the number of photos to be retrieved. Values between 1-100 are accepted. Defaults to 100.
     """
 
+    response_type = UserProfilePhotos
+    cache_ttl = 60
+    read_only = True
+
     def __init__(self, user_id,
                  offset=None,
                  limit=None,
@@ -817,6 +833,9 @@ class getFile(BaseMethod):
          File identifier to get info about
     """
 
+    response_type = File
+    read_only = True
+
     def __init__(self, file_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -837,6 +856,8 @@ class kickChatMember(BaseMethod):
          Date when the user will be unbanned, unix time. If user is banned for more than 366 days or less than 30 seconds from the current time they are considered to be banned forever
     """
 
+    invalidates = ('getChatMember', 'getChatAdministrators', 'getChatMembersCount')
+
     def __init__(self, chat_id,
                  user_id,
                  until_date=None,
@@ -859,6 +880,8 @@ class unbanChatMember(BaseMethod):
          Unique identifier of the target user
     """
 
+    invalidates = ('getChatMember', 'getChatAdministrators', 'getChatMembersCount')
+
     def __init__(self, chat_id,
                  user_id,
                  propagate_values: bool = False,
@@ -883,6 +906,8 @@ class restrictChatMember(BaseMethod):
          Date when restrictions will be lifted for the user, unix time. If user is restricted for more than 366 days or less than 30 seconds from the current time, they are considered to be restricted forever
     """
 
+    invalidates = ('getChatMember',)
+
     def __init__(self, chat_id,
                  user_id,
                  permissions,
@@ -923,6 +948,8 @@ class promoteChatMember(BaseMethod):
          Pass True, if the administrator can add new administrators with a subset of their own privileges or demote administrators that he has promoted, directly or indirectly (promoted by administrators that were appointed by him)
     """
 
+    invalidates = ('getChatMember', 'getChatAdministrators')
+
     def __init__(self, chat_id,
                  user_id,
                  can_change_info=None,
@@ -961,6 +988,8 @@ class setChatAdministratorCustomTitle(BaseMethod):
          New custom title for the administrator; 0-16 characters, emoji are not allowed
     """
 
+    invalidates = ('getChatMember', 'getChatAdministrators')
+
     def __init__(self, chat_id,
                  user_id,
                  custom_title,
@@ -983,6 +1012,8 @@ class setChatPermissions(BaseMethod):
          New default chat permissions
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  permissions,
                  propagate_values: bool = False,
@@ -1019,6 +1050,8 @@ class setChatPhoto(BaseMethod):
          New chat photo, uploaded using multipart/form-data
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  photo,
                  propagate_values: bool = False,
@@ -1037,6 +1070,8 @@ class deleteChatPhoto(BaseMethod):
          Unique identifier for the target chat or username of the target channel (in the format @channelusername)
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -1055,6 +1090,8 @@ class setChatTitle(BaseMethod):
          New chat title, 1-255 characters
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  title,
                  propagate_values: bool = False,
@@ -1075,6 +1112,8 @@ class setChatDescription(BaseMethod):
          New chat description, 0-255 characters
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  description=None,
                  propagate_values: bool = False,
@@ -1097,6 +1136,8 @@ class pinChatMessage(BaseMethod):
          Pass True, if it is not necessary to send a notification to all chat members about the new pinned message. Notifications are always disabled in channels.
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  message_id,
                  disable_notification=None,
@@ -1117,6 +1158,8 @@ class unpinChatMessage(BaseMethod):
          Unique identifier for the target chat or username of the target channel (in the format @channelusername)
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -1133,6 +1176,8 @@ class leaveChat(BaseMethod):
          Unique identifier for the target chat or username of the target supergroup or channel (in the format @channelusername)
     """
 
+    invalidates = ('getChat', 'getChatMember', 'getChatAdministrators', 'getChatMembersCount')
+
     def __init__(self, chat_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -1149,6 +1194,10 @@ class getChat(BaseMethod):
          Unique identifier for the target chat or username of the target supergroup or channel (in the format @channelusername)
     """
 
+    response_type = Chat
+    cache_ttl = 60
+    read_only = True
+
     def __init__(self, chat_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -1165,6 +1214,10 @@ class getChatAdministrators(BaseMethod):
          Unique identifier for the target chat or username of the target supergroup or channel (in the format @channelusername)
     """
 
+    response_type = [ChatMember]
+    cache_ttl = 60
+    read_only = True
+
     def __init__(self, chat_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -1181,6 +1234,9 @@ class getChatMembersCount(BaseMethod):
          Unique identifier for the target chat or username of the target supergroup or channel (in the format @channelusername)
     """
 
+    cache_ttl = 60
+    read_only = True
+
     def __init__(self, chat_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -1199,6 +1255,10 @@ class getChatMember(BaseMethod):
          Unique identifier of the target user
     """
 
+    response_type = ChatMember
+    cache_ttl = 60
+    read_only = True
+
     def __init__(self, chat_id,
                  user_id,
                  propagate_values: bool = False,
@@ -1219,6 +1279,8 @@ class setChatStickerSet(BaseMethod):
          Name of the sticker set to be set as the group sticker set
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  sticker_set_name,
                  propagate_values: bool = False,
@@ -1237,6 +1299,8 @@ class deleteChatStickerSet(BaseMethod):
          Unique identifier for the target chat or username of the target supergroup (in the format @supergroupusername)
     """
 
+    invalidates = ('getChat',)
+
     def __init__(self, chat_id,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
@@ -1261,6 +1325,8 @@ class answerCallbackQuery(BaseMethod):
          The maximum amount of time in seconds that the result of the callback query may be cached client-side. Telegram apps will support caching starting in version 3.14. Defaults to 0.
     """
 
+    priority = Priority.INTERACTIVE
+
     def __init__(self, callback_query_id,
                  text=None,
                  show_alert=None,
@@ -1294,6 +1360,8 @@ class setMyCommands(BaseMethod):
 
 class MessageUpdate(BaseMethod):
 
+    local_fields = BaseMethod.local_fields + ('message',)
+
     def get_method_body(self):
         if self.message:
             self.chat_id = self.message.chat.id
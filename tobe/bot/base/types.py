@@ -26,6 +26,9 @@ class User(BaseType):
          True, if the bot supports inline queries. Returned only in getMe.
     """
 
+    __slots__ = ('id', 'is_bot', 'first_name', 'last_name', 'username', 'language_code', 'can_join_groups',
+                 'can_read_all_group_messages', 'supports_inline_queries', '__weakref__')
+
     def __init__(self, id,
                  is_bot,
                  first_name,
@@ -81,6 +84,10 @@ class Chat(BaseType):
          True, if the bot can change the group sticker set. Returned only in getChat.
     """
 
+    __slots__ = ('id', '_type', 'title', 'username', 'first_name', 'last_name', 'photo', 'description', 'invite_link',
+                 'pinned_message', 'permissions', 'slow_mode_delay', 'sticker_set_name', 'can_set_sticker_set',
+                 '__weakref__')
+
     def __init__(self, id,
                  _type,
                  title=None,
@@ -216,6 +223,15 @@ class Message(BaseType):
          Inline keyboard attached to the message. login_url buttons are represented as ordinary url buttons.
     """
 
+    __slots__ = ('message_id', '_from', 'date', 'chat', 'forward_from', 'forward_from_chat', 'forward_from_message_id',
+                 'forward_signature', 'forward_sender_name', 'forward_date', 'reply_to_message', 'via_bot', 'edit_date',
+                 'media_group_id', 'author_signature', 'text', 'entities', 'animation', 'audio', 'document', 'photo',
+                 'sticker', 'video', 'video_note', 'voice', 'caption', 'caption_entities', 'contact', 'dice', 'game',
+                 'poll', 'venue', 'location', 'new_chat_members', 'left_chat_member', 'new_chat_title',
+                 'new_chat_photo', 'delete_chat_photo', 'group_chat_created', 'supergroup_chat_created',
+                 'channel_chat_created', 'migrate_to_chat_id', 'migrate_from_chat_id', 'pinned_message', 'invoice',
+                 'successful_payment', 'connected_website', 'passport_data', 'reply_markup')
+
     def __init__(self, message_id,
                  date,
                  chat,
@@ -288,8 +304,8 @@ class Message(BaseType):
         self.photo = PhotoSize.parse(photo, iterable=True)
         self.sticker = sticker # <-Sticker
         self.video = Video.parse(video)
-        self.video_note = MessageEntity.parse(video_note, iterable=True)
-        self.voice = voice
+        self.video_note = VideoNote.parse(video_note)
+        self.voice = Voice.parse(voice)
         self.caption = caption
         self.caption_entities = caption_entities
         self.contact = Contact.parse(contact)
@@ -335,6 +351,8 @@ class MessageEntity(BaseType):
          For “pre” only, the programming language of the entity text
     """
 
+    __slots__ = ('type', 'offset', 'length', 'url', 'user', 'language')
+
     def __init__(self, _type,
                  offset,
                  length,
@@ -366,6 +384,8 @@ class PhotoSize(BaseType):
          File size
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'file_size')
+
     def __init__(self, file_id,
                  file_unique_id,
                  width,
@@ -403,6 +423,9 @@ class Animation(BaseType):
          File size
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name', 'mime_type',
+                 'file_size')
+
     def __init__(self, file_id,
                  file_unique_id,
                  width,
@@ -446,6 +469,8 @@ class Audio(BaseType):
          Thumbnail of the album cover to which the music file belongs
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'performer', 'title', 'mime_type', 'file_size', 'thumb')
+
     def __init__(self, file_id,
                  file_unique_id,
                  duration,
@@ -483,6 +508,8 @@ class Document(BaseType):
          File size
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'thumb', 'file_name', 'mime_type', 'file_size')
+
     def __init__(self, file_id,
                  file_unique_id,
                  thumb=None,
@@ -520,6 +547,8 @@ class Video(BaseType):
          File size
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'mime_type', 'file_size')
+
     def __init__(self, file_id,
                  file_unique_id,
                  width,
@@ -557,6 +586,8 @@ class VideoNote(BaseType):
          File size
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'length', 'duration', 'thumb', 'file_size')
+
     def __init__(self, file_id,
                  file_unique_id,
                  length,
@@ -588,6 +619,8 @@ class Voice(BaseType):
          File size
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'mime_type', 'file_size')
+
     def __init__(self, file_id,
                  file_unique_id,
                  duration,
@@ -617,6 +650,8 @@ class Contact(BaseType):
          Additional data about the contact in the form of a vCard
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'user_id', 'vcard')
+
     def __init__(self, phone_number,
                  first_name,
                  last_name=None,
@@ -640,6 +675,8 @@ class Dice(BaseType):
          Value of the dice, 1-6 for “” and “” base emoji, 1-5 for “” base emoji
     """
 
+    __slots__ = ('emoji', 'value')
+
     def __init__(self, emoji,
                  value):
         self.emoji = emoji
@@ -657,6 +694,8 @@ class PollOption(BaseType):
          Number of users that voted for this option
     """
 
+    __slots__ = ('text', 'voter_count')
+
     def __init__(self, text,
                  voter_count):
         self.text = text
@@ -676,6 +715,8 @@ class PollAnswer(BaseType):
          0-based identifiers of answer options, chosen by the user. May be empty if the user retracted their vote.
     """
 
+    __slots__ = ('poll_id', 'user', 'option_ids')
+
     def __init__(self, poll_id,
                  user,
                  option_ids):
@@ -717,6 +758,10 @@ class Poll(BaseType):
          Point in time (Unix timestamp) when the poll will be automatically closed
     """
 
+    __slots__ = ('id', 'question', 'options', 'total_voter_count', 'is_closed', 'is_anonymous', 'type',
+                 'allows_multiple_answers', 'correct_option_id', 'explanation', 'explanation_entities', 'open_period',
+                 'close_date')
+
     def __init__(self, id,
                  question,
                  options,
@@ -756,6 +801,8 @@ class Location(BaseType):
          Latitude as defined by sender
     """
 
+    __slots__ = ('longitude', 'latitude')
+
     def __init__(self, longitude,
                  latitude):
         self.longitude = longitude
@@ -779,6 +826,8 @@ class Venue(BaseType):
          Foursquare type of the venue. (For example, “arts_entertainment/default”, “arts_entertainment/aquarium” or “food/icecream”.)
     """
 
+    __slots__ = ('location', 'title', 'address', 'foursquare_id', 'foursquare_type')
+
     def __init__(self, location,
                  title,
                  address,
@@ -802,6 +851,8 @@ class UserProfilePhotos(BaseType):
          Requested profile pictures (in up to 4 sizes each)
     """
 
+    __slots__ = ('total_count', 'photos')
+
     def __init__(self, total_count,
                  photos):
         self.total_count = total_count
@@ -823,6 +874,8 @@ class File(BaseType):
          File path. Use https://api.telegram.org/file/bot<token>/<file_path> to get the file.
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_path')
+
     def __init__(self, file_id,
                  file_unique_id,
                  file_size=None,
@@ -848,6 +901,8 @@ class ReplyKeyboardMarkup(BaseType):
          Use this parameter if you want to show the keyboard to specific users only. Targets: 1) users that are @mentioned in the text of the Message object; 2) if the bot's message is a reply (has reply_to_message_id), sender of the original message.Example: A user requests to change the bot's language, bot replies to the request with a keyboard to select the new language. Other users in the group don't see the keyboard.
     """
 
+    __slots__ = ('keyboard', 'resize_keyboard', 'one_time_keyboard', 'selective')
+
     def __init__(self, keyboard,
                  resize_keyboard=None,
                  one_time_keyboard=None,
@@ -873,6 +928,8 @@ class KeyboardButton(BaseType):
          If specified, the user will be asked to create a poll and send it to the bot when the button is pressed. Available in private chats only
     """
 
+    __slots__ = ('text', 'request_contact', 'request_location', 'request_poll')
+
     def __init__(self, text,
                  request_contact=None,
                  request_location=None,
@@ -892,6 +949,8 @@ class KeyboardButtonPollType(BaseType):
          If quiz is passed, the user will be allowed to create only polls in the quiz mode. If regular is passed, only regular polls will be allowed. Otherwise, the user will be allowed to create a poll of any type.
     """
 
+    __slots__ = ('type',)
+
     def __init__(self, _type=None):
         self.type = _type
 
@@ -907,6 +966,8 @@ class ReplyKeyboardRemove(BaseType):
          Use this parameter if you want to remove the keyboard for specific users only. Targets: 1) users that are @mentioned in the text of the Message object; 2) if the bot's message is a reply (has reply_to_message_id), sender of the original message.Example: A user votes in a poll, bot returns confirmation message in reply to the vote and removes the keyboard for that user, while still showing the keyboard with poll options to users who haven't voted yet.
     """
 
+    __slots__ = ('remove_keyboard', 'selective')
+
     def __init__(self, remove_keyboard=True,
                  selective=None):
         self.remove_keyboard = remove_keyboard
@@ -922,6 +983,8 @@ class InlineKeyboardMarkup(BaseType):
          Array of button rows, each represented by an Array of InlineKeyboardButton objects
     """
 
+    __slots__ = ('inline_keyboard',)
+
     def __init__(self, inline_keyboard):
         self.inline_keyboard = self.inline_keyboard_parser(inline_keyboard)
 
@@ -931,7 +994,10 @@ class InlineKeyboardMarkup(BaseType):
         for row in value:
             temp_row = []
             for keyboard_button in row:
-                temp_row.append(InlineKeyboardButton.parse(keyboard_button))
+                if not isinstance(keyboard_button, InlineKeyboardButton):
+                    keyboard_button = InlineKeyboardButton.parse(keyboard_button)
+                temp_row.append(keyboard_button)
+            rows.append(temp_row)
         return rows
 
 
@@ -958,6 +1024,9 @@ class InlineKeyboardButton(BaseType):
          Specify True, to send a Pay button.NOTE: This type of button must always be the first button in the first row.
     """
 
+    __slots__ = ('text', 'url', 'login_url', 'callback_data', 'switch_inline_query', 'switch_inline_query_current_chat',
+                 'callback_game', 'pay')
+
     def __init__(self, text,
                  url=None,
                  login_url=None,
@@ -991,6 +1060,8 @@ class LoginUrl(BaseType):
          Pass True to request the permission for your bot to send messages to the user.
     """
 
+    __slots__ = ('url', 'forward_text', 'bot_username', 'request_write_access')
+
     def __init__(self, url,
                  forward_text=None,
                  bot_username=None,
@@ -1022,6 +1093,8 @@ class CallbackQuery(BaseType):
          Short name of a Game to be returned, serves as the unique identifier for the game
     """
 
+    __slots__ = ('id', '_from', 'message', 'inline_message_id', 'chat_instance', 'data', 'game_short_name')
+
     def __init__(self, id,
                  _from,
                  chat_instance,
@@ -1049,6 +1122,8 @@ class ForceReply(BaseType):
          Use this parameter if you want to force reply from specific users only. Targets: 1) users that are @mentioned in the text of the Message object; 2) if the bot's message is a reply (has reply_to_message_id), sender of the original message.
     """
 
+    __slots__ = ('force_reply', 'selective')
+
     def __init__(self, force_reply,
                  selective=None):
         self.force_reply = force_reply
@@ -1070,6 +1145,8 @@ class ChatPhoto(BaseType):
          Unique file identifier of big (640x640) chat photo, which is supposed to be the same over time and for different bots. Can't be used to download or reuse the file.
     """
 
+    __slots__ = ('small_file_id', 'small_file_unique_id', 'big_file_id', 'big_file_unique_id')
+
     def __init__(self, small_file_id,
                  small_file_unique_id,
                  big_file_id,
@@ -1125,6 +1202,11 @@ class ChatMember(BaseType):
          Restricted only. True, if the user is allowed to add web page previews to their messages
     """
 
+    __slots__ = ('user', 'status', 'custom_title', 'until_date', 'can_be_edited', 'can_post_messages',
+                 'can_edit_messages', 'can_delete_messages', 'can_restrict_members', 'can_promote_members',
+                 'can_change_info', 'can_invite_users', 'can_pin_messages', 'is_member', 'can_send_messages',
+                 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages', 'can_add_web_page_previews')
+
     def __init__(self, user,
                  status,
                  custom_title=None,
@@ -1188,6 +1270,9 @@ class ChatPermissions(BaseType):
          True, if the user is allowed to pin messages. Ignored in public supergroups
     """
 
+    __slots__ = ('can_send_messages', 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages',
+                 'can_add_web_page_previews', 'can_change_info', 'can_invite_users', 'can_pin_messages')
+
     def __init__(self, can_send_messages=None,
                  can_send_media_messages=None,
                  can_send_polls=None,
@@ -1217,6 +1302,8 @@ class BotCommand(BaseType):
          Description of the command, 3-256 characters.
     """
 
+    __slots__ = ('command', 'description')
+
     def __init__(self, command,
                  description):
         self.command = command
@@ -1234,6 +1321,8 @@ class Parameters(BaseType):
          In case of exceeding flood control, the number of seconds left to wait before the request can be repeated
     """
 
+    __slots__ = ('migrate_to_chat_id', 'retry_after')
+
     def __init__(self, migrate_to_chat_id=None,
                  retry_after=None):
         self.migrate_to_chat_id = migrate_to_chat_id
@@ -1255,6 +1344,8 @@ class InputMediaPhoto(BaseType):
          Mode for parsing entities in the photo caption. See formatting options for more details.
     """
 
+    __slots__ = ('type', 'media', 'caption', 'parse_mode')
+
     def __init__(self, type,
                  media,
                  caption=None,
@@ -1290,6 +1381,8 @@ class InputMediaVideo(BaseType):
          Pass True, if the uploaded video is suitable for streaming
     """
 
+    __slots__ = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'width', 'height', 'duration', 'supports_streaming')
+
     def __init__(self, type,
                  media,
                  thumb=None,
@@ -1333,6 +1426,8 @@ class InputMediaAnimation(BaseType):
          Animation duration
     """
 
+    __slots__ = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'width', 'height', 'duration')
+
     def __init__(self, type,
                  media,
                  thumb=None,
@@ -1374,6 +1469,8 @@ class InputMediaAudio(BaseType):
          Title of the audio
     """
 
+    __slots__ = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'duration', 'performer', 'title')
+
     def __init__(self, type,
                  media,
                  thumb=None,
@@ -1409,6 +1506,8 @@ class InputMediaDocument(BaseType):
          Mode for parsing entities in the document caption. See formatting options for more details.
     """
 
+    __slots__ = ('type', 'media', 'thumb', 'caption', 'parse_mode')
+
     def __init__(self, type,
                  media,
                  thumb=None,
@@ -1,16 +1,53 @@
+import asyncio
+import functools
+import threading
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from .methods import BaseMethod
+from .types import is_failed
 from .base.methods import getMe
 from .decorators import propagate_value
+from .transports import Httplib2Transport
+from .aio import AsyncHTTPClient
+from .polling import Poller, AsyncPoller, run, run_async
+
+
+# Marker for requests not started after failure in concurrent execution.
+CANCELLED = object()
 
 
 class Bot:
     """Main bot class."""
 
-    def __init__(self, token=None):
+    def __init__(self, token=None, transport=None, rate_limiter=None, retry_policy=None, file_cache=None,
+                 response_cache=None, single_flight=None):
+        """
+        Parameters
+        ----------
+            token: str
+                Bot access token.
+            transport: Transport, optional
+                Http transport reused by all executed methods, Httplib2Transport with keep-alive connections by default.
+            rate_limiter: RateLimiter, optional
+                Scheduler which delays requests to stay under telegram limits.
+            retry_policy: RetryPolicy, optional
+                Retry engine for throttled (429), failed with 5xx or network error requests.
+            file_cache: FileIdCache, optional
+                Cache of file_id of uploaded files, same file content is uploaded only once.
+            response_cache: ResponseCache, optional
+                Cache of responses of read-only methods like getChat, invalidated by mutating methods.
+            single_flight: SingleFlight, optional
+                Coalescing of identical in-flight read-only requests into one.
+        """
         self.token = token
         self.propagated_values = {}
+        self.transport = transport or Httplib2Transport()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.file_cache = file_cache
+        self.response_cache = response_cache
+        self.single_flight = single_flight
 
     def set_token(self, token:str):
         self.token = token
@@ -19,15 +56,34 @@ class Bot:
         return self.token
 
     def sync(self):
-        for key, value in self.execute(getMe()).__dict__.items():
+        for key, value in self.execute(getMe()).as_dict().items():
             setattr(self, key, value)
         return self
 
     def clear_cache(self):
         self.propagated_values = {}
 
+    def close(self):
+        """Close all pooled connections."""
+        self.transport.close()
+
+    def iter_updates(self, **options):
+        """Iterator of updates received with long polling, offset is managed by it.
+
+        Options are same as of Poller: timeout, limit, allowed_updates, offset, commit ('before' or 'after'
+        processing of batch), lazy, identity_map and error_delay.
+        """
+        return iter(Poller(self, **options))
+
+    def run_polling(self, handler, **options):
+        """Call handler(update), like Router.dispatch, for every update received with long polling, blocks forever.
+
+        Options are same as in iter_updates.
+        """
+        run(Poller(self, **options), handler)
+
     @propagate_value(update_id='offset')
-    def execute(self, cmd, forced=False, propogate=False, propagate_fields=None):
+    def execute(self, cmd, forced=False, propogate=False, propagate_fields=None, concurrency=None):
         """Execution command(s).
 
         Parameters
@@ -41,6 +97,10 @@ class Bot:
                 Fields which need to propogate into the bot (for saving it for next request).
                 User key=value syntax, where key - field from method, value - field to bot.
                 Supports inherit strictures, like - 'message.chat.id'.
+            concurrency: int, optional
+                Execute up to concurrency commands at once in thread pool, responses are kept in input order.
+                If forced=False, commands are not started after first failure is seen and responses
+                are truncated at first failure, same as in sequential execution.
         """
 
         result = None # Result of execution, iterable or type instance.
@@ -48,29 +108,199 @@ class Bot:
         assert isinstance(cmd, Iterable) or isinstance(
             cmd, BaseMethod), 'cmd must be instance of BaseMethod or iter of BaseMethod.'
 
-        if isinstance(cmd, Iterable):
+        budget = self.retry_policy.new_budget() if self.retry_policy else None
+
+        if isinstance(cmd, Iterable) and concurrency and concurrency > 1:
+            result = self._execute_concurrent(cmd, forced, propogate, concurrency, budget)
+        elif isinstance(cmd, Iterable):
             result = []
             for num, method in enumerate(cmd):
-                    # If global propogate is enabled.
-                    method.set_token(self.get_token())
-                    if propogate:
-                        method = method.propagate_from_bot(self)
-                    elif method.propagate_values:
-                        method = method.propagate_from_bot(self)
-                    if forced:
-                        response = method.execute()
-                        result.append((response, method.propagate_fields))
-                    else:
-                        response = method.execute()
-                        result.append((response, method.propagate_fields))
-                        if response.status == False:
-                            break
+                    method = self.prepare(method, propogate)
+                    response = self._execute_one(method, budget)
+                    result.append((response, method.propagate_fields))
+                    if not forced and is_failed(response):
+                        break
         else:
-            cmd.set_token(self.get_token())
-            if propogate:
-                cmd = cmd.propagate_from_bot(self)
-            elif cmd.propagate_values:
-                cmd = cmd.propagate_from_bot(self)
-            result = (cmd.execute(), cmd.propagate_fields)
+            cmd = self.prepare(cmd, propogate)
+            result = (self._execute_one(cmd, budget), cmd.propagate_fields)
         return result[0] if isinstance(result, Iterable) and len(result) == 1 else result
 
+    def _execute_one(self, method, budget=None):
+        send = self._send
+        if self.retry_policy is not None:
+            send = functools.partial(self.retry_policy.call, send=send, budget=budget)
+        if self.file_cache is not None:
+            send = functools.partial(self.file_cache.call, send=send)
+        if self.single_flight is not None:
+            send = functools.partial(self.single_flight.call, send=send)
+        if self.response_cache is not None:
+            send = functools.partial(self.response_cache.call, send=send)
+        return send(method)
+
+    def _send(self, method):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method)
+        return method.execute(transport=self.transport)
+
+    def _execute_concurrent(self, cmds, forced, propogate, concurrency, budget=None):
+        methods = [self.prepare(method, propogate) for method in cmds]
+        responses = [CANCELLED] * len(methods)
+        lock = threading.Lock()
+        state = {'next': 0, 'stop': False}
+
+        def work():
+            while True:
+                # Methods are taken in input order, none is started after failure is seen.
+                with lock:
+                    if state['stop'] or state['next'] >= len(methods):
+                        return
+                    num = state['next']
+                    state['next'] += 1
+                try:
+                    response = self._execute_one(methods[num], budget)
+                except BaseException as exc:
+                    response = exc
+                responses[num] = response
+                if isinstance(response, BaseException) or not forced and is_failed(response):
+                    with lock:
+                        state['stop'] = True
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(work) for _ in range(min(concurrency, len(methods)))]:
+                future.result()
+        return self._collect(methods, responses, forced)
+
+    @staticmethod
+    def _collect(methods, responses, forced):
+        """Responses in input order, truncated at first failure like sequential execution."""
+        result = []
+        for method, response in zip(methods, responses):
+            if response is CANCELLED:
+                break
+            if isinstance(response, BaseException):
+                raise response
+            result.append((response, method.propagate_fields))
+            if not forced and is_failed(response):
+                break
+        return result
+
+    def prepare(self, method, propogate=False):
+        """Set bot token to method and load propagated values if it's required."""
+        method.set_token(self.get_token())
+        # If global propogate is enabled.
+        if propogate or method.propagate_values:
+            method = method.propagate_from_bot(self)
+        return method
+
+
+class AsyncBot(Bot):
+    """Bot with asyncio execution, methods are sent through non-blocking keep-alive http client."""
+
+    def __init__(self, token=None, transport=None, rate_limiter=None, retry_policy=None, file_cache=None,
+                 response_cache=None, single_flight=None):
+        """Parameters are same as of Bot, transport is AsyncTransport, AsyncHTTPClient by default."""
+        super().__init__(token, transport or AsyncHTTPClient(), rate_limiter, retry_policy, file_cache,
+                         response_cache, single_flight)
+
+    async def sync(self):
+        for key, value in (await self.execute(getMe())).as_dict().items():
+            setattr(self, key, value)
+        return self
+
+    async def close(self):
+        """Close all pooled connections."""
+        await self.transport.close()
+
+    def iter_updates(self, **options):
+        """Async iterator of updates received with long polling, same as Bot.iter_updates."""
+        return AsyncPoller(self, **options).__aiter__()
+
+    async def run_polling(self, handler, **options):
+        """Await handler(update) for every update received with long polling, same as Bot.run_polling."""
+        await run_async(AsyncPoller(self, **options), handler)
+
+    @propagate_value(update_id='offset')
+    async def execute(self, cmd, forced=False, propogate=False, propagate_fields=None, concurrency=None):
+        """Execution command(s), same as Bot.execute but awaitable.
+
+        Parameters
+        ----------
+            cmd: instance(BaseMethod) or Iterable of BaseMethod instances.
+                List of command which need's to execute.
+            forced: bool
+                If forced=True, skip failed executions if commands were acquired as list of methods.
+                If forced=false, if get failed execution, stop send next commands.
+            progate_fields: dict
+                Fields which need to propogate into the bot (for saving it for next request).
+            concurrency: int, optional
+                Keep up to concurrency commands in flight at once, responses are kept in input order.
+        """
+        assert isinstance(cmd, Iterable) or isinstance(
+            cmd, BaseMethod), 'cmd must be instance of BaseMethod or iter of BaseMethod.'
+
+        if isinstance(cmd, Iterable):
+            result = await self._execute_many(cmd, forced, propogate, concurrency)
+            return result[0] if len(result) == 1 else result
+
+        cmd = self.prepare(cmd, propogate)
+        return await self._execute_one(cmd), cmd.propagate_fields
+
+    @propagate_value(update_id='offset')
+    async def execute_many(self, cmds, forced=False, propogate=False, propagate_fields=None, concurrency=None):
+        """Execution of commands, always returns list of responses.
+
+        Parameters are same as in execute.
+        """
+        return await self._execute_many(cmds, forced, propogate, concurrency)
+
+    async def _execute_one(self, method, budget=None):
+        send = self._send
+        if self.retry_policy is not None:
+            send = functools.partial(self.retry_policy.call_async, send=send, budget=budget)
+        if self.file_cache is not None:
+            send = functools.partial(self.file_cache.call_async, send=send)
+        if self.single_flight is not None:
+            send = functools.partial(self.single_flight.call_async, send=send)
+        if self.response_cache is not None:
+            send = functools.partial(self.response_cache.call_async, send=send)
+        return await send(method)
+
+    async def _send(self, method):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(method)
+        return await method.execute_async(self.transport)
+
+    async def _execute_many(self, cmds, forced, propogate, concurrency):
+        budget = self.retry_policy.new_budget() if self.retry_policy else None
+        if concurrency and concurrency > 1:
+            return await self._execute_concurrent(cmds, forced, propogate, concurrency, budget)
+
+        result = []
+        for method in cmds:
+            method = self.prepare(method, propogate)
+            response = await self._execute_one(method, budget)
+            result.append((response, method.propagate_fields))
+            if not forced and is_failed(response):
+                break
+        return result
+
+    async def _execute_concurrent(self, cmds, forced, propogate, concurrency, budget=None):
+        methods = [self.prepare(method, propogate) for method in cmds]
+        responses = [CANCELLED] * len(methods)
+        # Workers run in one event loop, state is changed between awaits only.
+        state = {'next': 0, 'stop': False}
+
+        async def work():
+            while not state['stop'] and state['next'] < len(methods):
+                num = state['next']
+                state['next'] += 1
+                try:
+                    response = await self._execute_one(methods[num], budget)
+                except Exception as exc:
+                    response = exc
+                responses[num] = response
+                if isinstance(response, Exception) or not forced and is_failed(response):
+                    state['stop'] = True
+
+        await asyncio.gather(*[work() for _ in range(min(concurrency, len(methods)))])
+        return self._collect(methods, responses, forced)
@@ -0,0 +1,223 @@
+import copy
+import itertools
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .priority import Priority
+from .ratelimit import RateLimiter
+from .templates import MethodTemplate
+from .types import is_failed
+
+
+class BroadcastStats:
+    """Progress of broadcast."""
+
+    def __init__(self, total=None, done=0, sent=0, failed=0, errors=0):
+        self.total = total
+        self.done = done
+        self.sent = sent
+        self.failed = failed
+        self.errors = errors
+        self.started_at = time.monotonic()
+        self._started_done = done
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self):
+        """Processed chats per second in current run."""
+        elapsed = self.elapsed
+        return (self.done - self._started_done) / elapsed if elapsed else 0.0
+
+    @property
+    def eta(self):
+        """Seconds left to finish, None if total is unknown or nothing is processed yet."""
+        throughput = self.throughput
+        if self.total is None or not throughput:
+            return None
+        return max(self.total - self.done, 0) / throughput
+
+    def __repr__(self):
+        eta = f'{self.eta:.0f}s' if self.eta is not None else '?'
+        return (f'<BroadcastStats done={self.done}/{self.total or "?"} sent={self.sent} failed={self.failed} '
+                f'errors={self.errors} throughput={self.throughput:.1f}/s eta={eta}>')
+
+
+class Checkpoint:
+    """Progress file of broadcast, stores number of processed chats (all chats before it are done) and counters.
+
+    File is replaced atomically, so crash in the middle of save leaves previous checkpoint.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def save(self, **progress):
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(progress, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class Broadcast:
+    """Send one method to many chats.
+
+    Chat ids are streamed from iterator with bounded memory: at most window chats are kept in flight.
+    Requests go through bot, so bot retry policy is applied. Telegram rate limits are applied
+    by bot rate limiter or, if bot has none, by own one. Methods have Priority.BULK:
+    with send_queue interactive answers of same bot are sent ahead of broadcast.
+
+    Parameters
+    ----------
+    bot : Bot
+        Bot which executes methods.
+    template : BaseMethod
+        Method which is copied for every chat, with chat_id replaced.
+        It's body is encoded once with MethodTemplate, unless method has files.
+    chat_ids : iterable
+        Chat ids, iterator is consumed lazily.
+    checkpoint : str, optional
+        Path of checkpoint file, broadcast resumes from it after crash.
+        Chat ids iterator must yield same ids in same order on resume.
+    concurrency : int
+        Number of requests executed at once.
+    window : int, optional
+        Maximum number of chats taken from iterator but not finished yet, concurrency * 4 by default.
+    rate_limiter : RateLimiter, optional
+        Limiter used if bot has no own one, default RateLimiter is created if not provided.
+    total : int, optional
+        Number of chats, for ETA. len(chat_ids) is used if chat_ids supports it.
+    checkpoint_interval : float
+        Seconds between checkpoint saves.
+    on_progress : callable, optional
+        Called with BroadcastStats after every checkpoint save.
+    on_failure : callable, optional
+        Called with (chat_id, response or exception) for every failed chat.
+    send_queue : SendQueue, optional
+        Queue of bot which methods are submitted to, instead of executing them directly.
+    """
+
+    def __init__(self, bot, template, chat_ids,
+                 checkpoint=None,
+                 concurrency=8,
+                 window=None,
+                 rate_limiter=None,
+                 total=None,
+                 checkpoint_interval=5.0,
+                 on_progress=None,
+                 on_failure=None,
+                 send_queue=None):
+        self.bot = bot
+        self.send_queue = send_queue
+        self.template = template
+        try:
+            self.method_template = MethodTemplate(template)
+        except ValueError:
+            self.method_template = None
+        self.chat_ids = chat_ids
+        self.checkpoint = Checkpoint(checkpoint) if checkpoint else None
+        self.concurrency = concurrency
+        self.window = window or concurrency * 4
+        self.rate_limiter = None if bot.rate_limiter else rate_limiter or RateLimiter()
+        self.checkpoint_interval = checkpoint_interval
+        self.on_progress = on_progress
+        self.on_failure = on_failure
+
+        if total is None and hasattr(chat_ids, '__len__'):
+            total = len(chat_ids)
+        self.stats = BroadcastStats(total)
+
+    def make_method(self, chat_id):
+        if self.method_template is not None:
+            method = self.method_template.bind(chat_id=chat_id)
+        else:
+            method = copy.copy(self.template)
+            method.chat_id = chat_id
+        method.priority = Priority.BULK
+        return method
+
+    def send(self, chat_id):
+        method = self.make_method(chat_id)
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(method)
+            if self.send_queue is not None:
+                response = self.send_queue.submit(method).result()
+            else:
+                response = self.bot.execute(method)
+        except Exception as exc:
+            return chat_id, exc
+        return chat_id, response
+
+    def run(self):
+        """Send template to all chats, blocks until done.
+
+        Returns
+        -------
+            BroadcastStats.
+        """
+        progress = self.checkpoint.load() if self.checkpoint else {}
+        self.stats = BroadcastStats(self.stats.total, **progress)
+        chat_ids = itertools.islice(iter(self.chat_ids), self.stats.done, None)
+
+        # Futures in input order, checkpoint moves only over contiguous prefix of finished chats.
+        pending = deque()
+        saved_at = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for chat_id in chat_ids:
+                if len(pending) >= self.window:
+                    self.account(pending.popleft().result())
+                pending.append(executor.submit(self.send, chat_id))
+
+                while pending and pending[0].done():
+                    self.account(pending.popleft().result())
+                if time.monotonic() - saved_at >= self.checkpoint_interval:
+                    self.save()
+                    saved_at = time.monotonic()
+
+            while pending:
+                self.account(pending.popleft().result())
+
+        self.save()
+        return self.stats
+
+    def account(self, result):
+        chat_id, response = result
+        self.stats.done += 1
+        if isinstance(response, Exception):
+            self.stats.errors += 1
+        elif is_failed(response):
+            self.stats.failed += 1
+        else:
+            self.stats.sent += 1
+            return
+        if self.on_failure:
+            self.on_failure(chat_id, response)
+
+    def save(self):
+        if self.checkpoint:
+            self.checkpoint.save(done=self.stats.done, sent=self.stats.sent, failed=self.stats.failed,
+                                 errors=self.stats.errors)
+        if self.on_progress:
+            self.on_progress(self.stats)
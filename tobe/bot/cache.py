@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from .types import is_failed
+
+
+# Fields which define object touched by method, first present one is used.
+SCOPE_FIELDS = ('chat_id', 'name', 'user_id')
+
+
+def method_scope(method):
+    """Get object touched by method, like chat id or sticker set name, None if method has no such field."""
+    for field in SCOPE_FIELDS:
+        value = getattr(method, field, None)
+        if value is not None:
+            return str(value)
+    return None
+
+
+class ResponseCache:
+    """Read-through TTL/LRU cache of responses of read-only methods.
+
+    Caching is opt-in per method class: only responses of methods with cache_ttl set are kept.
+    Mutating methods list method names in invalidates, cached responses of these methods
+    for same chat (or sticker set) are dropped after every execution of mutating method.
+    Cached responses are shared between callers and must not be modified.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of cached responses, least recently used are evicted.
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._entries = OrderedDict() # key -> (expires_at, response, method_name, scope)
+        self._scopes = defaultdict(set) # (method_name, scope) -> keys
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, response, ttl, method_name, scope=None):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, response, method_name, scope)
+            self._scopes[(method_name, scope)].add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, _, method_name, scope = self._entries.pop(key)
+        keys = self._scopes[(method_name, scope)]
+        keys.discard(key)
+        if not keys:
+            del self._scopes[(method_name, scope)]
+
+    def invalidate(self, method_names, scope=None):
+        """Drop cached responses of methods, only for given scope if it's provided."""
+        with self._lock:
+            for method_name in method_names:
+                if scope is not None:
+                    groups = [(method_name, scope)]
+                else:
+                    groups = [group for group in self._scopes if group[0] == method_name]
+                for group in groups:
+                    for key in list(self._scopes.get(group, ())):
+                        self._remove(key)
+                        self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def stats(self):
+        """Hit/miss metrics of cache."""
+        requests = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / requests if requests else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def call(self, method, send):
+        """Execute method with send(method) callable, answering cached methods from cache."""
+        if method.invalidates:
+            try:
+                return send(method)
+            finally:
+                # Request may change data even if it failed on network level.
+                self.invalidate(method.invalidates, method_scope(method))
+        # Streamed responses are iterated once, they can't be shared.
+        if method.cache_ttl is None or getattr(method, 'stream', False):
+            return send(method)
+
+        key = method.get_request_key()
+        response = self.get(key)
+        if response is None:
+            response = send(method)
+            if not is_failed(response):
+                self.put(key, response, method.cache_ttl, method.method_name, method_scope(method))
+        return response
+
+    async def call_async(self, method, send):
+        """Same as call, but send(method) is awaitable."""
+        if method.invalidates:
+            try:
+                return await send(method)
+            finally:
+                self.invalidate(method.invalidates, method_scope(method))
+        if method.cache_ttl is None or getattr(method, 'stream', False):
+            return await send(method)
+
+        key = method.get_request_key()
+        response = self.get(key)
+        if response is None:
+            response = await send(method)
+            if not is_failed(response):
+                self.put(key, response, method.cache_ttl, method.method_name, method_scope(method))
+        return response
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Coalescing of identical in-flight requests.
+
+    Read-only methods (with read_only set) which are equal by class, token and serialized body
+    share one request while it's in flight, all callers receive it's response.
+    Shared responses must not be modified.
+    """
+
+    def __init__(self):
+        self._calls = {} # key -> Future of sync request
+        self._tasks = {} # key -> asyncio.Task of async request
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.coalesced = 0
+
+    def call(self, method, send):
+        """Execute method with send(method) callable, joining identical request if it's in flight."""
+        # Streamed responses are iterated once, they can't be shared.
+        if not method.read_only or getattr(method, 'stream', False):
+            return send(method)
+
+        key = method.get_request_key()
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                self.requests += 1
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            response = send(method)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def call_async(self, method, send):
+        """Same as call, but send(method) is awaitable."""
+        if not method.read_only or getattr(method, 'stream', False):
+            return await send(method)
+
+        key = method.get_request_key()
+        task = self._tasks.get(key)
+        if task is None:
+            self.requests += 1
+            task = self._tasks[key] = asyncio.ensure_future(send(method))
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Cancellation of one caller doesn't cancel request of others.
+        return await asyncio.shield(task)
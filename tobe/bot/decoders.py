@@ -0,0 +1,117 @@
+import inspect
+import sys
+import threading
+
+from .schema import type_fields
+from .services import fix_built_ins
+
+
+_decoders = {}
+_lock = threading.RLock()
+
+
+def get_decoder(cls, identity_map=None):
+    """Get decode function of type, it's generated on first use.
+
+    Generated function builds type instance from decoded json dict without calling constructor:
+    telegram names like from and type are read into _from and _type, nested types are decoded
+    by their own generated functions and unknown fields are ignored. Types which constructor
+    does more than assignments are built with cls(**fields) with unknown fields dropped.
+
+    With identity_map decoders of it are used: objects of it's types are shared
+    and it's low-cardinality string fields are interned.
+    """
+    decoders = _decoders if identity_map is None else identity_map.decoders
+    decoder = decoders.get(cls)
+    if decoder is None:
+        with _lock:
+            decoder = decoders.get(cls)
+            if decoder is None:
+                # Decoders in progress are visible only to this build, they are published when all are complete.
+                building = {}
+                decoder = _build_decoder(cls, decoders, identity_map, building)
+                decoders.update(building)
+    return decoder
+
+
+def decode(cls, data, iterable=False):
+    """Decode dict (or list of dicts if iterable) into type instance, same as cls.parse, None for empty data."""
+    if not data:
+        return None
+    decoder = get_decoder(cls)
+    if iterable:
+        return [decoder(item) for item in data]
+    return decoder(data)
+
+
+def _build_decoder(cls, decoders, identity_map, building):
+    # Lazy types (see lazy_type) keep decoded json, nested types are decoded from it on access.
+    lazy = '_lazy_fields' in cls.__dict__
+    fields = type_fields(cls.__mro__[1] if lazy else cls)
+    if fields is None:
+        decoder = building[cls] = _kwargs_decoder(cls)
+        return decoder
+
+    interned = identity_map.interned if identity_map is not None else ()
+    namespace = {'cls': cls, 'new': object.__new__, 'intern': sys.intern}
+    lines = [f'def decode_{cls.__name__}(data):', '    get = data.get', '    obj = new(cls)']
+    nested = []
+    for num, field in enumerate(fields):
+        if field.type_name is None:
+            default = 'None'
+            if field.default is not None:
+                default = f'default{num}'
+                namespace[default] = field.default
+            if field.wire_name in interned:
+                lines += [f'    value = get({field.wire_name!r}, {default})',
+                          f'    obj.{field.name} = intern(value) if value.__class__ is str else value']
+            else:
+                lines.append(f'    obj.{field.name} = get({field.wire_name!r}, {default})')
+            continue
+
+        # Same as X.parse(value) in constructor: empty values are None.
+        if lazy:
+            # Absent values are set at once, attribute access doesn't fall back to __getattr__ for them.
+            lines += [f'    if not get({field.wire_name!r}):', f'        obj.{field.name} = None']
+            continue
+        decoder_name = f'decode{num}'
+        nested.append((decoder_name, field.type))
+        lines.append(f'    value = get({field.wire_name!r})')
+        if field.iterable:
+            lines.append(f'    obj.{field.name} = [{decoder_name}(item) for item in value] if value else None')
+        else:
+            lines.append(f'    obj.{field.name} = {decoder_name}(value) if value else None')
+    if lazy:
+        lines.append('    obj._raw = data')
+    if cls._after_parse is not None:
+        lines.append('    obj._after_parse(data)')
+    lines.append('    return obj')
+
+    exec('\n'.join(lines), namespace)
+    decoder = namespace[f'decode_{cls.__name__}']
+    if identity_map is not None and cls in identity_map.types:
+        decoder = identity_map.wrap(cls, decoder)
+    # Registered before nested decoders are built, types may contain themselves (Message.reply_to_message).
+    building[cls] = decoder
+    for decoder_name, nested_type in nested:
+        nested_decoder = decoders.get(nested_type) or building.get(nested_type)
+        if nested_decoder is None:
+            nested_decoder = _build_decoder(nested_type, decoders, identity_map, building)
+        namespace[decoder_name] = nested_decoder
+    return decoder
+
+
+def _kwargs_decoder(cls):
+    parameters = inspect.signature(cls.__init__).parameters
+    if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters.values()):
+        names = None
+    else:
+        names = frozenset(parameters)
+
+    def decode_kwargs(data):
+        data = fix_built_ins(dict(data))
+        if names is not None:
+            data = {key: value for key, value in data.items() if key in names}
+        return cls(**data)
+
+    return decode_kwargs
@@ -1,5 +1,9 @@
+import asyncio
+import functools
 from collections.abc import Iterable
 
+from .streaming import ResponseStream
+
 
 def propagate_value(**values):
     """Parse values from response and push to class instance witch method was decorated.
@@ -11,27 +15,37 @@ def propagate_value(**values):
     """
 
     def first_wrapper(func):
+        if asyncio.iscoroutinefunction(func):
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                return propagate_result(values, args[0], result, kwargs)
+            return async_wrapper
+
         def second_wrapper(*args, **kwargs):
 
             # Get self argument.
             self = args[0]
             result = func(*args, **kwargs)
+            return propagate_result(values, self, result, kwargs)
+        return second_wrapper
+    return first_wrapper
 
-            # Add additional fields in values which need to pass in bot [from execute].
-            if 'propagate_fields' in kwargs and isinstance(kwargs['propagate_fields'], dict):
-                for from_method, to_bot in kwargs['propagate_fields'].items():
-                    values.update({from_method: to_bot})
+def propagate_result(values, self, result, kwargs):
+    """Push values from execution result into bot and return responses only."""
 
-            if isinstance(result, list):
-                # If response are iterable push last found value.
-                for response in result:
-                    propogate_block(values, response, self)
-            else:
-                propogate_block(values, result, self)
+    # Add additional fields in values which need to pass in bot [from execute].
+    if 'propagate_fields' in kwargs and isinstance(kwargs['propagate_fields'], dict):
+        for from_method, to_bot in kwargs['propagate_fields'].items():
+            values.update({from_method: to_bot})
 
-            return [item[0] for item in result] if isinstance(result, list) else result[0]
-        return second_wrapper
-    return first_wrapper
+    if isinstance(result, list):
+        # If response are iterable push last found value.
+        for response in result:
+            propogate_block(values, response, self)
+    else:
+        propogate_block(values, result, self)
+
+    return [item[0] for item in result] if isinstance(result, list) else result[0]
 
 def propogate_block(values, response, self):
     response, propagate_field_from_method = response[0], response[1]
@@ -49,6 +63,10 @@ def propagate_values(values, response, self_instance):
         temp_value = response
         error = False
 
+        if isinstance(temp_value, ResponseStream):
+            # Stream is not read here, values are pushed while it's iterated.
+            temp_value.add_callback(functools.partial(propagate_item, key, value, self_instance))
+            continue
         if isinstance(temp_value, Iterable):
             for inner_response in temp_value:
                 temp_value, error = get_inner_values(inner_response, key)
@@ -63,6 +81,15 @@ def propagate_values(values, response, self_instance):
         })
 
 
+def propagate_item(key, value, self_instance, item):
+    """Push value from item of streamed response."""
+    temp_value, error = get_inner_values(item, key)
+    if not error:
+        self_instance.propagated_values.update({
+            value: temp_value
+        })
+
+
 def get_inner_values(response, key_str):
     keys = key_str.split('.')
     answer = response
@@ -0,0 +1,254 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from .base.methods import getFile
+from .base.types import File
+from .broadcast import Checkpoint
+from .methods import BaseMethod
+from .retry import NETWORK_ERRORS
+from .transports import HTTPClientTransport
+from .types import is_failed
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadError(Exception):
+    """File can't be downloaded, getFile failed or file server answered with error status."""
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class RangeNotSupported(DownloadError):
+    """File server ignored Range header and answered with whole file."""
+
+
+class DownloadManager:
+    """Download files by file_id or File with constant memory.
+
+    Body is streamed to temporary file in chunks. Interrupted downloads are resumed with Range requests,
+    both after network errors and after restart of program (partial file is kept next to destination).
+    Large files may be split into ranged parts which are downloaded in parallel.
+
+    Parameters
+    ----------
+    bot : Bot
+        Bot which resolves file_id with getFile, it's token is used in file urls.
+    concurrency : int
+        Number of files downloaded at once by download_many.
+    max_connections : int
+        Maximum number of open connections to file server, shared by all downloads and parts.
+    part_size : int, optional
+        Files larger than part_size bytes are downloaded in parallel parts of this size, not split if None.
+    chunk_size : int
+        Bytes read from socket and written to disk at once.
+    retries : int
+        Number of resumes of one stream after network errors.
+    timeout : float, optional
+        Socket timeout in seconds.
+    ssl_context : ssl.SSLContext, optional
+        Context for https connections, default context is used if not provided.
+    """
+
+    def __init__(self, bot,
+                 concurrency=4,
+                 max_connections=8,
+                 part_size=None,
+                 chunk_size=CHUNK_SIZE,
+                 retries=5,
+                 timeout=60.0,
+                 ssl_context=None):
+        self.bot = bot
+        self.concurrency = concurrency
+        self.max_connections = max_connections
+        self.part_size = part_size
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.transport = HTTPClientTransport(timeout=timeout, ssl_context=ssl_context, max_size=max_connections)
+
+    def get_file_url(self, file_path):
+        # https://api.telegram.org/bot -> https://api.telegram.org/file/bot<token>/<file_path>
+        base_url = BaseMethod.request_url[:-len('bot')]
+        return f'{base_url}file/bot{self.bot.token}/{file_path}'
+
+    def resolve(self, file):
+        """Get File with file_path for file_id, File with file_path is returned as is."""
+        if isinstance(file, File) and file.file_path:
+            return file
+        file_id = file.file_id if isinstance(file, File) else file
+        response = self.bot.execute(getFile(file_id))
+        if is_failed(response):
+            raise DownloadError(f'getFile failed for {file_id}: {response.description}', response)
+        return response
+
+    def download(self, file, path):
+        """Download file to path, partial download left at same path is resumed.
+
+        Parameters
+        ----------
+            file: str or File
+                File id or File object.
+            path: str
+                Destination path, data is written to path + '.part' and moved to path when complete.
+
+        Returns
+        -------
+            Path of downloaded file.
+        """
+        file = self.resolve(file)
+        url = self.get_file_url(file.file_path)
+        if self.part_size and file.file_size and file.file_size > self.part_size:
+            try:
+                self._download_parts(url, path, file.file_size)
+                return path
+            except RangeNotSupported:
+                # File is downloaded again by one stream.
+                os.remove(path + '.part')
+                Checkpoint(path + '.progress').clear()
+        self._download_stream(url, path, file.file_size)
+        return path
+
+    def download_many(self, files):
+        """Download files, up to concurrency at once.
+
+        Parameters
+        ----------
+            files: iterable
+                Pairs (file_id or File, path).
+
+        Returns
+        -------
+            List of paths in input order, exception instance for every failed download.
+        """
+        def download(item):
+            try:
+                return self.download(*item)
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(download, files))
+
+    def _download_stream(self, url, path, size=None):
+        temp_path = path + '.part'
+        with open(temp_path, 'ab') as file:
+            offset = file.tell()
+            if size is not None and offset > size:
+                # Partial file doesn't belong to this file.
+                file.truncate(0)
+                offset = 0
+            if size is None or offset < size:
+                try:
+                    for _, chunk in self.stream(url, offset):
+                        file.write(chunk)
+                except RangeNotSupported:
+                    file.truncate(0)
+                    for _, chunk in self.stream(url):
+                        file.write(chunk)
+        os.replace(temp_path, path)
+
+    def _download_parts(self, url, path, size):
+        temp_path = path + '.part'
+        checkpoint = Checkpoint(path + '.progress')
+        ranges = [(start, min(start + self.part_size, size)) for start in range(0, size, self.part_size)]
+
+        progress = checkpoint.load()
+        if (os.path.exists(temp_path) and progress.get('size') == size
+                and progress.get('part_size') == self.part_size):
+            done = progress['done']
+        else:
+            with open(temp_path, 'wb') as file:
+                file.truncate(size)
+            done = [0] * len(ranges)
+
+        lock = threading.Lock()
+        saved_at = [time.monotonic()]
+
+        def download_part(num):
+            start, end = ranges[num]
+            if start + done[num] >= end:
+                return
+            fd = os.open(temp_path, os.O_WRONLY)
+            try:
+                for offset, chunk in self.stream(url, start + done[num], end):
+                    os.pwrite(fd, chunk, offset)
+                    done[num] += len(chunk)
+                    # Progress is saved after data is written, so resume never skips missing bytes.
+                    if time.monotonic() - saved_at[0] >= 1.0:
+                        with lock:
+                            checkpoint.save(size=size, part_size=self.part_size, done=list(done))
+                            saved_at[0] = time.monotonic()
+            finally:
+                os.close(fd)
+
+        with ThreadPoolExecutor(max_workers=min(len(ranges), self.max_connections)) as executor:
+            try:
+                for future in [executor.submit(download_part, num) for num in range(len(ranges))]:
+                    future.result()
+            finally:
+                with lock:
+                    checkpoint.save(size=size, part_size=self.part_size, done=list(done))
+
+        os.replace(temp_path, path)
+        checkpoint.clear()
+
+    def stream(self, url, start=0, end=None):
+        """Iterate over (offset, chunk) of file body from start to end (exclusive), resuming after network errors."""
+        parts = urlsplit(url)
+        pool = self.transport.get_pool(parts.scheme, parts.netloc)
+        ranged = start > 0 or end is not None
+        attempt = 0
+        while end is None or start < end:
+            pooled = pool.acquire()
+            try:
+                headers = {}
+                if ranged:
+                    headers['range'] = f'bytes={start}-{end - 1 if end is not None else ""}'
+                pooled.connection.request('GET', parts.path, headers=headers)
+                response = pooled.connection.getresponse()
+                if response.status not in (200, 206):
+                    response.read()
+                    raise DownloadError(f'File server answered with {response.status} for {parts.path}.')
+                if ranged and response.status == 200:
+                    raise RangeNotSupported('File server does not support ranges.')
+                if end is None and response.length is not None:
+                    # http.client returns empty chunk on early close, known length tells that body is incomplete.
+                    end = start + response.length
+
+                while end is None or start < end:
+                    chunk = response.read(self.chunk_size if end is None else min(self.chunk_size, end - start))
+                    if not chunk:
+                        break
+                    yield start, chunk
+                    start += len(chunk)
+                    attempt = 0
+            except NETWORK_ERRORS:
+                pool.release(pooled, reuse=False)
+                if attempt >= self.retries:
+                    raise
+                # Connection broke in the middle of body, continue from last received byte.
+                time.sleep(min(0.5 * 2 ** attempt, 10.0))
+                attempt += 1
+                ranged = True
+                continue
+            except BaseException:
+                pool.release(pooled, reuse=False)
+                raise
+            if end is not None and start < end:
+                # Body ended before requested range, repeat range request from last byte.
+                pool.release(pooled, reuse=False)
+                if attempt >= self.retries:
+                    raise DownloadError(f'File server closed body of {parts.path} at {start} of {end} bytes.')
+                attempt += 1
+                ranged = True
+                continue
+            pool.release(pooled, reuse=not response.will_close)
+            return
+
+    def close(self):
+        self.transport.close()
@@ -0,0 +1,67 @@
+import threading
+
+from . import jsonlib
+from .schema import wire_name
+from .types import BaseType
+
+
+_encoders = {}
+_lock = threading.RLock()
+
+
+def dumps(value):
+    """Encode value as json str with json backend, types are written with their encoders, None fields are skipped."""
+    return jsonlib.dumps(value, default=encode)
+
+
+def dumpb(value):
+    """Same as dumps, but json is encoded as utf-8 bytes, ready to be sent as request body."""
+    return jsonlib.dumpb(value, default=encode)
+
+
+def encode(value):
+    """Default hook of json backend: dict of type instance with telegram field names.
+
+    Raises
+    ------
+        TypeError
+            Value is not BaseType instance.
+    """
+    encoder = _encoders.get(value.__class__)
+    if encoder is None:
+        if not isinstance(value, BaseType):
+            raise TypeError(f'Object of type {value.__class__.__name__} is not JSON serializable')
+        encoder = get_encoder(value.__class__)
+    return encoder(value)
+
+
+def get_encoder(cls):
+    """Get encode function of type, it's generated on first use.
+
+    Generated function maps type instance to dict field by field: None fields are skipped,
+    attributes like _from and _type are written as from and type. Nested types are left
+    as is, json backend calls encode for them while it writes the dict.
+    """
+    encoder = _encoders.get(cls)
+    if encoder is None:
+        with _lock:
+            encoder = _encoders.get(cls)
+            if encoder is None:
+                encoder = _build_encoder(cls)
+    return encoder
+
+
+def _build_encoder(cls):
+    lines = [f'def encode_{cls.__name__}(obj):', '    data = {}']
+    for name in cls._fields:
+        lines += [
+            f'    value = getattr(obj, {name!r}, None)',
+            '    if value is not None:',
+            f'        data[{wire_name(name)!r}] = value',
+        ]
+    lines.append('    return data')
+
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    encoder = _encoders[cls] = namespace[f'encode_{cls.__name__}']
+    return encoder
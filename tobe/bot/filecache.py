@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from .multipart import InputFile, is_file
+from .types import is_failed
+
+
+# Method fields with uploaded file, sent Message has file with reusable file_id in field of same name.
+FILE_FIELDS = ('photo', 'audio', 'document', 'video', 'animation', 'voice', 'video_note', 'sticker')
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Parts of 400 error descriptions about unknown or expired file_id, like "wrong file identifier/HTTP URL specified".
+# Other 400 errors (chat not found, caption is too long) don't make cached file_id invalid.
+STALE_FILE_ERRORS = ('file identifier', 'file_id', 'file reference')
+
+
+class FileIdCache:
+    """Upload once cache of file_id, keyed by hash of file content.
+
+    Files of send* methods are hashed before sending. If same content was uploaded before, file_id is sent
+    instead of bytes, otherwise file is uploaded and file_id from sent message is stored.
+    Cache is kept in SQLite database and survives restarts.
+
+    Parameters
+    ----------
+    path : str
+        Database file path, in memory database is used by default.
+    """
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS files ('
+                         'digest TEXT, field TEXT, file_id TEXT, file_unique_id TEXT, created_at REAL, '
+                         'PRIMARY KEY (digest, field))')
+        # Hashes of local files, file is hashed again only if it's size or modification time is changed.
+        self._db.execute('CREATE TABLE IF NOT EXISTS paths ('
+                         'path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT)')
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def hash_file(self, value):
+        """Get sha256 hex digest of file content, file objects are hashed from current position."""
+        if isinstance(value, InputFile) and value.path is not None:
+            path = os.path.abspath(value.path)
+            stat = os.stat(path)
+            with self._lock:
+                row = self._db.execute('SELECT digest FROM paths WHERE path = ? AND size = ? AND mtime_ns = ?',
+                                       (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+            if row:
+                return row[0]
+            with open(path, 'rb') as file:
+                digest = hash_content(file)
+            with self._lock:
+                self._db.execute('INSERT OR REPLACE INTO paths VALUES (?, ?, ?, ?)',
+                                 (path, stat.st_size, stat.st_mtime_ns, digest))
+            return digest
+
+        file = value.open() if isinstance(value, InputFile) else value
+        offset = file.tell()
+        try:
+            return hash_content(file)
+        finally:
+            file.seek(offset)
+
+    def get(self, digest, field):
+        with self._lock:
+            row = self._db.execute('SELECT file_id FROM files WHERE digest = ? AND field = ?',
+                                   (digest, field)).fetchone()
+        return row[0] if row else None
+
+    def put(self, digest, field, file_id, file_unique_id=None):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)',
+                             (digest, field, file_id, file_unique_id, time.time()))
+
+    def invalidate(self, digest, field):
+        with self._lock:
+            self._db.execute('DELETE FROM files WHERE digest = ? AND field = ?', (digest, field))
+            self.invalidated += 1
+
+    def prepare(self, method):
+        """Replace cached files of method with file_id.
+
+        Returns
+        -------
+            Tuple (replaced, uploaded), lists of (field, original value, digest).
+        """
+        replaced, uploaded = [], []
+        if not method.method_name.startswith('send'):
+            return replaced, uploaded
+        for field in FILE_FIELDS:
+            value = getattr(method, field, None)
+            if not is_file(value):
+                continue
+            digest = self.hash_file(value)
+            file_id = self.get(digest, field)
+            if file_id is None:
+                self.misses += 1
+                uploaded.append((field, value, digest))
+            else:
+                self.hits += 1
+                setattr(method, field, file_id)
+                replaced.append((field, value, digest))
+        return replaced, uploaded
+
+    def store(self, response, uploaded):
+        """Save file_id of uploaded files from sent message."""
+        if is_failed(response):
+            return
+        for field, _, digest in uploaded:
+            file_id, file_unique_id = sent_file_id(getattr(response, field, None))
+            if file_id is not None:
+                self.put(digest, field, file_id, file_unique_id)
+
+    def _restore(self, method, replaced):
+        for field, value, _ in replaced:
+            setattr(method, field, value)
+
+    def _stale(self, method, replaced, response):
+        # Telegram rejects unknown or expired file_id with 400, file is uploaded again then.
+        if not replaced or getattr(response, 'error_code', None) != 400:
+            return False
+        description = (getattr(response, 'description', None) or '').lower()
+        if not any(error in description for error in STALE_FILE_ERRORS):
+            return False
+        self._restore(method, replaced)
+        for field, _, digest in replaced:
+            self.invalidate(digest, field)
+        return True
+
+    def call(self, method, send):
+        """Execute method with send(method) callable, sending cached file_id instead of files."""
+        replaced, uploaded = self.prepare(method)
+        try:
+            response = send(method)
+            if self._stale(method, replaced, response):
+                uploaded, replaced = uploaded + replaced, []
+                response = send(method)
+            self.store(response, uploaded)
+            return response
+        finally:
+            self._restore(method, replaced)
+
+    async def call_async(self, method, send):
+        """Same as call, but send(method) is awaitable, files are hashed in thread pool."""
+        replaced, uploaded = await asyncio.get_running_loop().run_in_executor(None, self.prepare, method)
+        try:
+            response = await send(method)
+            if self._stale(method, replaced, response):
+                uploaded, replaced = uploaded + replaced, []
+                response = await send(method)
+            self.store(response, uploaded)
+            return response
+        finally:
+            self._restore(method, replaced)
+
+    def close(self):
+        self._db.close()
+
+
+def hash_content(file):
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sent_file_id(value):
+    """Get (file_id, file_unique_id) of file from sent message, largest size is taken for photos."""
+    if isinstance(value, list):
+        value = value[-1] if value else None
+    if isinstance(value, dict):
+        return value.get('file_id'), value.get('file_unique_id')
+    return getattr(value, 'file_id', None), getattr(value, 'file_unique_id', None)
@@ -88,6 +88,8 @@ class getGameHighScores(BaseMethod):
          Required if chat_id and message_id are not specified. Identifier of the inline message
     """
 
+    read_only = True
+
     def __init__(self, user_id,
                  chat_id=None,
                  message_id=None,
@@ -21,6 +21,8 @@ class Game(BaseType):
          Animation that will be displayed in the game message in chats. Upload via BotFather
     """
 
+    __slots__ = ('title', 'description', 'photo', 'text', 'text_entities', 'animation')
+
     def __init__(self, title,
                  description,
                  photo,
@@ -49,6 +51,8 @@ class GameHighScore(BaseType):
          Score
     """
 
+    __slots__ = ('position', 'user', 'score')
+
     def __init__(self, position,
                  user,
                  score):
@@ -0,0 +1,77 @@
+import functools
+import threading
+import weakref
+
+from .base.types import User, Chat
+
+
+# Fields with few distinct values, like chat type or entity type.
+INTERNED_FIELDS = frozenset((
+    'type', 'language_code', 'mime_type', 'currency', 'status', 'emoji', 'set_name',
+))
+
+
+class IdentityMap:
+    """Sharing of parsed objects which are repeated in updates, like sender and chat of messages.
+
+    Objects of types are kept weakly by id: while any parsed object references User or Chat,
+    same User or Chat in next updates is not built again, if it's json is equal.
+    Decoded json of shared objects is kept for comparison until objects are collected.
+    Strings of low-cardinality fields are interned. Shared objects must not be modified.
+    Lazy types are not shared.
+
+    Parameters
+    ----------
+    types : tuple of type
+        Types shared by id.
+    interned : iterable of str
+        Telegram names of fields which string values are interned.
+    """
+
+    def __init__(self, types=(User, Chat), interned=INTERNED_FIELDS):
+        self.types = tuple(types)
+        self.interned = frozenset(interned)
+        # Decoders which use this map, filled by get_decoder.
+        self.decoders = {}
+        self._entries = {cls: {} for cls in self.types} # id -> (weak reference of object, decoded json)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def wrap(self, cls, decoder):
+        """Make decoder of type return shared object if same one is already parsed."""
+        entries = self._entries[cls]
+        lock = self._lock
+
+        def remove(ref, key):
+            # Called when object is collected, entry may be replaced by newer object already.
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] is ref:
+                    del entries[key]
+
+        def decode_shared(data):
+            key = data.get('id')
+            entry = entries.get(key)
+            if entry is not None and entry[1] == data:
+                obj = entry[0]()
+                if obj is not None:
+                    self.hits += 1
+                    return obj
+            self.misses += 1
+            obj = decoder(data)
+            if key is not None:
+                with lock:
+                    entries[key] = (weakref.ref(obj, functools.partial(remove, key=key)), data)
+            return obj
+
+        return decode_shared
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
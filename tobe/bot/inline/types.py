@@ -18,6 +18,8 @@ class InlineQuery(BaseType):
          Offset of the results to be returned, can be controlled by the bot
     """
 
+    __slots__ = ('id', '_from', 'location', 'query', 'offset')
+
     def __init__(self, id,
                  _from,
                  query,
@@ -60,6 +62,9 @@ class InlineQueryResultArticle(BaseType):
          Thumbnail height
     """
 
+    __slots__ = ('type', 'id', 'title', 'input_message_content', 'reply_markup', 'url', 'hide_url', 'description',
+                 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self, type,
                  id,
                  title,
@@ -116,6 +121,9 @@ class InlineQueryResultPhoto(BaseType):
          Content of the message to be sent instead of the photo
     """
 
+    __slots__ = ('type', 'id', 'photo_url', 'thumb_url', 'photo_width', 'photo_height', 'title', 'description',
+                 'caption', 'parse_mode', 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  photo_url,
@@ -176,6 +184,9 @@ class InlineQueryResultGif(BaseType):
          Content of the message to be sent instead of the GIF animation
     """
 
+    __slots__ = ('type', 'id', 'gif_url', 'gif_width', 'gif_height', 'gif_duration', 'thumb_url', 'thumb_mime_type',
+                 'title', 'caption', 'parse_mode', 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  thumb_url,
@@ -238,6 +249,9 @@ class InlineQueryResultMpeg4Gif(BaseType):
          Content of the message to be sent instead of the video animation
     """
 
+    __slots__ = ('type', 'id', 'mpeg4_url', 'mpeg4_width', 'mpeg4_height', 'mpeg4_duration', 'thumb_url',
+                 'thumb_mime_type', 'title', 'caption', 'parse_mode', 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  thumb_url,
@@ -302,6 +316,9 @@ class InlineQueryResultVideo(BaseType):
          Content of the message to be sent instead of the video. This field is required if InlineQueryResultVideo is used to send an HTML-page as a result (e.g., a YouTube video).
     """
 
+    __slots__ = ('type', 'id', 'video_url', 'mime_type', 'thumb_url', 'title', 'caption', 'parse_mode', 'video_width',
+                 'video_height', 'video_duration', 'description', 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  video_url,
@@ -360,6 +377,9 @@ class InlineQueryResultAudio(BaseType):
          Content of the message to be sent instead of the audio
     """
 
+    __slots__ = ('type', 'id', 'audio_url', 'title', 'caption', 'parse_mode', 'performer', 'audio_duration',
+                 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  audio_url,
@@ -408,6 +428,9 @@ class InlineQueryResultVoice(BaseType):
          Content of the message to be sent instead of the voice recording
     """
 
+    __slots__ = ('type', 'id', 'voice_url', 'title', 'caption', 'parse_mode', 'voice_duration', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self, type,
                  id,
                  voice_url,
@@ -462,6 +485,9 @@ class InlineQueryResultDocument(BaseType):
          Thumbnail height
     """
 
+    __slots__ = ('type', 'id', 'title', 'caption', 'parse_mode', 'document_url', 'mime_type', 'description',
+                 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self, type,
                  id,
                  title,
@@ -520,6 +546,9 @@ class InlineQueryResultLocation(BaseType):
          Thumbnail height
     """
 
+    __slots__ = ('type', 'id', 'latitude', 'longitude', 'title', 'live_period', 'reply_markup', 'input_message_content',
+                 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self, type,
                  id,
                  latitude,
@@ -578,6 +607,9 @@ class InlineQueryResultVenue(BaseType):
          Thumbnail height
     """
 
+    __slots__ = ('type', 'id', 'latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type',
+                 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self, type,
                  id,
                  latitude,
@@ -636,6 +668,9 @@ class InlineQueryResultContact(BaseType):
          Thumbnail height
     """
 
+    __slots__ = ('type', 'id', 'phone_number', 'first_name', 'last_name', 'vcard', 'reply_markup',
+                 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self, type,
                  id,
                  phone_number,
@@ -676,6 +711,8 @@ class InlineQueryResultGame(BaseType):
          Inline keyboard attached to the message
     """
 
+    __slots__ = ('type', 'id', 'game_short_name', 'reply_markup')
+
     def __init__(self, type,
                  id,
                  game_short_name,
@@ -712,6 +749,9 @@ class InlineQueryResultCachedPhoto(BaseType):
          Content of the message to be sent instead of the photo
     """
 
+    __slots__ = ('type', 'id', 'photo_file_id', 'title', 'description', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self, type,
                  id,
                  photo_file_id,
@@ -756,6 +796,8 @@ class InlineQueryResultCachedGif(BaseType):
          Content of the message to be sent instead of the GIF animation
     """
 
+    __slots__ = ('type', 'id', 'gif_file_id', 'title', 'caption', 'parse_mode', 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  gif_file_id,
@@ -798,6 +840,9 @@ class InlineQueryResultCachedMpeg4Gif(BaseType):
          Content of the message to be sent instead of the video animation
     """
 
+    __slots__ = ('type', 'id', 'mpeg4_file_id', 'title', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self, type,
                  id,
                  mpeg4_file_id,
@@ -834,6 +879,8 @@ class InlineQueryResultCachedSticker(BaseType):
          Content of the message to be sent instead of the sticker
     """
 
+    __slots__ = ('type', 'id', 'sticker_file_id', 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  sticker_file_id,
@@ -872,6 +919,9 @@ class InlineQueryResultCachedDocument(BaseType):
          Content of the message to be sent instead of the file
     """
 
+    __slots__ = ('type', 'id', 'title', 'document_file_id', 'description', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self, type,
                  id,
                  title,
@@ -918,6 +968,9 @@ class InlineQueryResultCachedVideo(BaseType):
          Content of the message to be sent instead of the video
     """
 
+    __slots__ = ('type', 'id', 'video_file_id', 'title', 'description', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self, type,
                  id,
                  video_file_id,
@@ -962,6 +1015,9 @@ class InlineQueryResultCachedVoice(BaseType):
          Content of the message to be sent instead of the voice message
     """
 
+    __slots__ = ('type', 'id', 'voice_file_id', 'title', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self, type,
                  id,
                  voice_file_id,
@@ -1002,6 +1058,8 @@ class InlineQueryResultCachedAudio(BaseType):
          Content of the message to be sent instead of the audio
     """
 
+    __slots__ = ('type', 'id', 'audio_file_id', 'caption', 'parse_mode', 'reply_markup', 'input_message_content')
+
     def __init__(self, type,
                  id,
                  audio_file_id,
@@ -1032,6 +1090,8 @@ class InputTextMessageContent(BaseType):
          Disables link previews for links in the sent message
     """
 
+    __slots__ = ('message_text', 'parse_mode', 'disable_web_page_preview')
+
     def __init__(self, message_text,
                  parse_mode=None,
                  disable_web_page_preview=None):
@@ -1054,6 +1114,8 @@ class InputLocationMessageContent(BaseType):
          Period in seconds for which the location can be updated, should be between 60 and 86400.
     """
 
+    __slots__ = ('latitude', 'longitude', 'live_period')
+
     def __init__(self, latitude,
                  longitude,
                  live_period=None):
@@ -1082,6 +1144,8 @@ class InputVenueMessageContent(BaseType):
          Foursquare type of the venue, if known. (For example, �arts_entertainment/default�, �arts_entertainment/aquarium� or �food/icecream�.)
     """
 
+    __slots__ = ('latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type')
+
     def __init__(self, latitude,
                  longitude,
                  title,
@@ -1112,6 +1176,8 @@ class InputContactMessageContent(BaseType):
          Additional data about the contact in the form of a vCard, 0-2048 bytes
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard')
+
     def __init__(self, phone_number,
                  first_name,
                  last_name=None,
@@ -1140,6 +1206,8 @@ class ChosenInlineResult(BaseType):
          The query that was used to obtain the result
     """
 
+    __slots__ = ('result_id', '_from', 'location', 'inline_message_id', 'query')
+
     def __init__(self, result_id,
                  _from,
                  query,
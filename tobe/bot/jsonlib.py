@@ -0,0 +1,88 @@
+"""JSON backend used for request bodies and responses.
+
+Fastest installed library is used: orjson, then ujson, then standard json module.
+Backend can be changed with use(name), functions of this module must be called
+as jsonlib.loads(...), not imported by name, to follow the switch.
+"""
+import importlib
+import json
+
+
+BACKENDS = ('orjson', 'ujson', 'json')
+
+
+def _orjson(module):
+    def dumpb(value, default=None):
+        return module.dumps(value, default=default)
+
+    def dumps(value, default=None):
+        return module.dumps(value, default=default).decode()
+
+    return dumps, dumpb, module.loads
+
+
+def _ujson(module):
+    def dumpb(value, default=None):
+        return module.dumps(value, ensure_ascii=False, escape_forward_slashes=False, default=default).encode()
+
+    def dumps(value, default=None):
+        return module.dumps(value, ensure_ascii=False, escape_forward_slashes=False, default=default)
+
+    # ujson decodes bytes as utf-8 itself.
+    return dumps, dumpb, module.loads
+
+
+def _json(module):
+    def dumpb(value, default=None):
+        return module.dumps(value, ensure_ascii=False, separators=(',', ':'), default=default).encode()
+
+    def dumps(value, default=None):
+        return module.dumps(value, ensure_ascii=False, separators=(',', ':'), default=default)
+
+    return dumps, dumpb, module.loads
+
+
+_factories = {'orjson': _orjson, 'ujson': _ujson, 'json': _json}
+
+# Set by use(): name of backend and it's functions.
+# dumps(value, default=None) encodes value as json str, dumpb(value, default=None) as utf-8 json bytes
+# ready to be sent as request body, default(obj) returns serializable replacement of unsupported objects,
+# loads(data) decodes json from bytes (without decoding them to str first) or str.
+backend = None
+dumps = dumpb = loads = None
+
+
+def available():
+    """Names of installed backends."""
+    names = []
+    for name in BACKENDS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def use(name=None):
+    """Switch backend, first installed one of BACKENDS is used if name is not provided.
+
+    Raises
+    ------
+        ImportError
+            Backend library is not installed.
+        ValueError
+            Backend is not supported.
+    """
+    global backend, dumps, dumpb, loads
+
+    if name is None:
+        name = available()[0]
+    if name not in _factories:
+        raise ValueError(f'Unknown json backend {name!r}, supported are {", ".join(BACKENDS)}.')
+    module = json if name == 'json' else importlib.import_module(name)
+    dumps, dumpb, loads = _factories[name](module)
+    backend = name
+
+
+use()
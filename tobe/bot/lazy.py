@@ -0,0 +1,85 @@
+from .decoders import get_decoder
+from .schema import type_fields, wire_name
+
+
+def _lazy_getattr(self, name):
+    # Called only for attributes which are not built yet.
+    spec = self._lazy_specs.get(name)
+    if spec is None:
+        spec = _lazy_spec(type(self), name)
+    key, iterable, decoder = spec
+    value = self._raw.get(key)
+    if value:
+        # Same as X.parse(value): nested types are decoded by generated decoders, empty values are None.
+        value = [decoder(item) for item in value] if iterable else decoder(value)
+    else:
+        value = None
+    setattr(self, name, value)
+    return value
+
+
+def _lazy_spec(cls, name):
+    # Decoders are resolved on first access, nested types may be defined after type which uses them.
+    field = cls._lazy_fields.get(name)
+    if field is None:
+        raise AttributeError(f'{cls.__name__!r} object has no attribute {name!r}')
+    spec = cls._lazy_specs[name] = (field.wire_name, field.iterable, get_decoder(lazy_type(field.type)))
+    return spec
+
+
+def _lazy_init(self, **raw):
+    # Decoded json is kept by generated decoder, constructor gets parameters like _from.
+    raw = {wire_name(key): value for key, value in raw.items()}
+    if self._after_parse is not None:
+        self._after_parse(raw)
+    # Plain values are cheap to set, only nested types are built on access.
+    for field in self._plain_fields:
+        setattr(self, field.name, raw.get(field.wire_name, field.default))
+    self._raw = raw
+
+
+def _lazy_reduce(self):
+    # Lazy classes are created at runtime, so copies and pickles are made of built original type.
+    return _restore, (type(self).__mro__[1], self.as_dict())
+
+
+def _restore(cls, values):
+    instance = cls.__new__(cls)
+    for name, value in values.items():
+        setattr(instance, name, value)
+    if cls._after_parse is not None:
+        instance._after_parse(values)
+    return instance
+
+
+_lazy_types = {}
+
+
+def lazy_type(cls):
+    """Get lazy version of type.
+
+    Lazy type keeps decoded response dict and builds attributes (and nested types, lazy as well)
+    on first access with generated decoders, built values are kept in slots. Types which constructor
+    can't be read with type_fields are returned as is.
+    """
+    lazy = _lazy_types.get(cls)
+    if lazy is None:
+        fields = type_fields(cls)
+        if fields is None:
+            lazy = cls
+        else:
+            lazy = type(f'Lazy{cls.__name__}', (cls,), {
+                '__slots__': ('_raw',),
+                '__module__': cls.__module__,
+                '__doc__': f'{cls.__name__} which is parsed on attribute access.',
+                '__init__': _lazy_init,
+                '__getattr__': _lazy_getattr,
+                '__reduce__': _lazy_reduce,
+                '_lazy_fields': {field.name: field for field in fields if field.type_name is not None},
+                '_lazy_specs': {}, # name -> (json key, iterable, decoder)
+                '_plain_fields': tuple(field for field in fields if field.type_name is None),
+            })
+            # Raw dict is not attribute of type.
+            lazy._fields = cls._fields
+        _lazy_types[cls] = lazy
+    return lazy
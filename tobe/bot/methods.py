@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-import json
 from urllib.parse import urlencode
 from collections.abc import Iterable
 
 import httplib2
 
+from . import encoders, jsonlib
 from .types import BaseType, Error
-from .services import fix_built_ins
+from .decoders import get_decoder
+from .lazy import lazy_type
+from .priority import Priority
+from .multipart import MultipartEncoder, has_files
+from .streaming import ResponseStream
 
 
 class BaseMethod(ABC):
@@ -18,6 +22,28 @@ class BaseMethod(ABC):
     content_type = 'application/json'
     success_http_statuses = [200]
 
+    # Default priority class in send queue, can be overridden per instance.
+    priority = Priority.NORMAL
+
+    # Seconds to keep response in ResponseCache, responses are not cached if None.
+    cache_ttl = None
+    # Names of methods which cached responses are outdated by this method.
+    invalidates = ()
+    # Method doesn't change anything, identical in-flight requests may share one response.
+    read_only = False
+    # Array response is returned as ResponseStream, items are decoded while it's iterated.
+    stream = False
+    # Response is parsed into lazy types, which build nested objects on first access.
+    lazy = False
+    # MethodTemplate which encodes body of method, set by MethodTemplate.bind.
+    template = None
+    # IdentityMap which shares repeated objects of response.
+    identity_map = None
+    # Attributes which are not api parameters and are never sent,
+    # class options above are among them, so they may be overridden per instance.
+    local_fields = ('token', 'propagate_values', 'propagate_fields', 'method_name', 'response_type', 'priority',
+                    'cache_ttl', 'invalidates', 'read_only', 'stream', 'lazy', 'template', 'identity_map')
+
     @abstractmethod
     def __init__(self, *, propagate_values=False, propagate_fields=None):
         self.method_name = self.__class__.__name__
@@ -30,7 +56,12 @@ class BaseMethod(ABC):
         return self
 
     def serialize(self):
-        return json.dumps(self.__dict__)
+        return encoders.dumps(self.get_params())
+
+    def get_params(self):
+        """Api parameters of method, only None values and local fields are skipped."""
+        local_fields = self.local_fields
+        return {key: value for key, value in self.__dict__.items() if value is not None and key not in local_fields}
 
     def propagate_from_bot(self, bot_instance):
         """Load attrs from provided bot instance."""
@@ -47,48 +78,128 @@ class BaseMethod(ABC):
         return self.request_url + self.token + '/' + self.method_name
 
     def get_method_body(self):
-        """Generate request body for calling method api."""
-
-        data = dict(self.__dict__)
-        data.pop('token')
-        data.pop('propagate_values')
-        data.pop('method_name')
-        blank_keys = []
-        for key, value in data.items():
-            if not value:
-                blank_keys.append(key)
-        for key in blank_keys:
-            data.pop(key)
+        """Generate request body for calling method api.
+
+        Only None parameters are skipped, so 0, False and empty strings are sent.
+        """
+        if self.template is not None:
+            return self.template.render(self)
+        data = self.get_params()
+        if has_files(data):
+            # Files are streamed from disk, body is sent as multipart/form-data.
+            return MultipartEncoder(data)
         if self.http_method == 'GET':
-            return json.dumps(data)
+            return encoders.dumpb(data)
         else:
-            return urlencode(data)
+            return urlencode({key: value if isinstance(value, str) else encoders.dumps(value)
+                              for key, value in data.items()})
+
+    def get_webhook_body(self):
+        """Body of webhook response which calls method, None if method has files and must be sent with request.
+
+        Telegram executes method from response, it's result is not returned.
+        """
+        if self.template is None and (self.http_method != 'GET' or has_files(self.__dict__)):
+            # Checked before body is built, multipart body would open files.
+            return None
+        body = self.get_method_body()
+        method = b'{"method":' + encoders.dumpb(self.method_name)
+        return method + (b',' + body[1:] if len(body) > 2 else b'}')
+
+    def get_request_key(self):
+        """Key of identical requests: method class, token and serialized body."""
+        return self.__class__, self.token, self.get_method_body()
+
+    def get_method_headers(self):
+        """Generate request headers for calling method api."""
+        return {
+            'content-type': self.content_type
+        }
 
-    def execute(self):
-        """Send method request."""
+    def get_request(self):
+        """Generate http method, url, body and headers for calling method api.
+
+        Requests with files are always sent as POST with multipart body of precomputed length.
+        """
+        body = self.get_method_body()
+        headers = self.get_method_headers()
+        if isinstance(body, MultipartEncoder):
+            headers.update({'content-type': body.content_type, 'content-length': str(len(body))})
+            return 'POST', self.get_method_url(), body, headers
+        return self.http_method, self.get_method_url(), body, headers
+
+    def execute(self, transport=None):
+        """Send method request.
+
+        Parameters
+        ----------
+            transport: Transport, optional
+                Http transport shared between requests, like Httplib2Transport with keep-alive connections.
+                If not provided, new httplib2 connection is opened for this request only.
+        """
         assert hasattr(self, 'token'), 'Bot token must be provided for method execution.'
 
-        headers = {
-            'content-type': self.content_type
-        }
+        http_method, url, body, headers = self.get_request()
+        try:
+            if transport is None:
+                http = httplib2.Http()
+                resp, content = http.request(url, method=http_method, body=body, headers=headers)
+                return self.process_response(int(resp['status']), content)
+
+            status, content = transport.request(http_method, url, body=body, headers=headers)
+        finally:
+            if isinstance(body, MultipartEncoder):
+                body.close()
+        return self.process_response(status, content)
+
+    async def execute_async(self, transport):
+        """Send method request without blocking event loop.
+
+        Parameters
+        ----------
+            transport: AsyncTransport
+                Non-blocking http transport, like AsyncHTTPClient with keep-alive connections.
+        """
+        assert hasattr(self, 'token'), 'Bot token must be provided for method execution.'
 
-        http = httplib2.Http()
-        resp, content = http.request(self.get_method_url(), method=self.http_method, body=self.get_method_body(),
-                                     headers=headers)
-        if int(resp['status']) not in self.success_http_statuses:
-            return self.parse_response(content, Error)
+        http_method, url, body, headers = self.get_request()
+        try:
+            status, content = await transport.request(http_method, url, body=body, headers=headers)
+        finally:
+            if isinstance(body, MultipartEncoder):
+                body.close()
+        return self.process_response(status, content)
+
+    def process_response(self, status, content):
+        """Parse response content as method response type or as Error for unsuccessful status."""
+        if status not in self.success_http_statuses:
+            try:
+                return self.parse_response(content, Error)
+            except ValueError:
+                # Proxies and overloaded servers may answer with non json body, like html page on 502.
+                return Error(False, status, content.decode(errors='replace') if isinstance(content, bytes) else content)
         return self.parse_response(content)
 
     def parse_response(self, response, response_type=None):
         # Parse response and return once of available response types.
 
-        response = json.loads(response)
+        if self.stream and not response_type and isinstance(self.response_type, Iterable):
+            return ResponseStream(response, self.get_result_decoder())
+        response = jsonlib.loads(response)
+        if not response_type and not isinstance(response['result'], (dict, list)):
+            # Methods like deleteMessage answer with plain value, usually True.
+            return response['result']
         if isinstance(self.response_type, Iterable) and not response_type:
             # If response type have a kind [response_type,] for multiple responses.
-            self.response_type = self.response_type[0]
-            return [self.response_type(**fix_built_ins(result)) for result in response['result']]
+            decoder = self.get_result_decoder()
+            return [decoder(result) for result in response['result']]
         else:
-            return self.response_type(**fix_built_ins(response['result'])) if not response_type else response_type(**response)
+            return self.get_result_decoder()(response['result']) if not response_type else response_type(**response)
+
+    def get_result_decoder(self):
+        """Decoder of result, or of it's items for array results."""
+        result_type = self.response_type[0] if isinstance(self.response_type, Iterable) else self.response_type
+        return get_decoder(lazy_type(result_type) if self.lazy else result_type, self.identity_map)
 
 
 
@@ -0,0 +1,217 @@
+import asyncio
+import mimetypes
+import os
+import uuid
+from io import IOBase
+
+from . import jsonlib
+from .types import BaseType
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class InputFile:
+    """File to upload with multipart/form-data.
+
+    Parameters
+    ----------
+    file : str or binary file object
+        Path to local file or opened file object, file object is read from it's current position.
+    filename : str, optional
+        Name of file sent to telegram, basename of path by default.
+    content_type : str, optional
+        Mime type, guessed from filename by default.
+    """
+
+    def __init__(self, file, filename=None, content_type=None):
+        if isinstance(file, (str, os.PathLike)):
+            self.path = os.fspath(file)
+            self.file = None
+        else:
+            self.path = None
+            self.file = file
+        self.filename = filename or os.path.basename(self.path or getattr(file, 'name', None) or 'file')
+        self.content_type = content_type or mimetypes.guess_type(self.filename)[0] or 'application/octet-stream'
+
+    def open(self):
+        """Get file object opened for binary read."""
+        if self.file is None:
+            self.file = open(self.path, 'rb')
+        return self.file
+
+    def close(self):
+        # Only files opened by InputFile are closed.
+        if self.path is not None and self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def is_file(value):
+    return isinstance(value, (InputFile, IOBase))
+
+
+class FilePart:
+    """File part of multipart body, remembers start offset and size of file, so body can be sent again on retry."""
+
+    def __init__(self, input_file):
+        self.input_file = input_file if isinstance(input_file, InputFile) else InputFile(input_file)
+        self.file = self.input_file.open()
+        self.offset = self.file.tell()
+        try:
+            self.size = os.fstat(self.file.fileno()).st_size - self.offset
+        except (AttributeError, OSError, ValueError):
+            # Not real file (like BytesIO), size is found by seeking to end.
+            self.size = self.file.seek(0, os.SEEK_END) - self.offset
+            self.file.seek(self.offset)
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        self.file.seek(self.offset)
+        left = self.size
+        try:
+            while left > 0:
+                chunk = self.file.read(min(chunk_size, left))
+                if not chunk:
+                    raise IOError(f'File {self.input_file.filename} was truncated during upload.')
+                left -= len(chunk)
+                yield chunk
+        finally:
+            self.rewind()
+
+    def rewind(self):
+        # Leave file where it was found, so same file object may be uploaded again.
+        self.file.seek(self.offset)
+
+
+class MultipartEncoder:
+    """Streaming multipart/form-data body.
+
+    Files are never loaded into memory: body is produced in chunks, Content-Length is computed from file sizes
+    before sending, and write_to uses zero-copy sendfile where socket allows it.
+
+    Parameters
+    ----------
+    fields : dict
+        Name -> value, values are encoded as text (json for lists, dicts and types), files are attached.
+    """
+
+    def __init__(self, fields, chunk_size=CHUNK_SIZE):
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.fields = {}
+        self.files = {}
+        self.parts = []
+
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if is_file(value):
+                self.add_file(name, value)
+            else:
+                self.add_field(name, encode_field(value, self))
+        self.parts.append(f'--{self.boundary}--\r\n'.encode())
+
+    def add_field(self, name, value):
+        self.fields[name] = value
+        self.parts.append(f'--{self.boundary}\r\ncontent-disposition: form-data; name="{name}"\r\n\r\n'.encode()
+                          + value.encode() + b'\r\n')
+
+    def add_file(self, name, value):
+        part = FilePart(value)
+        filename = part.input_file.filename.replace('"', '')
+        self.files[name] = filename
+        self.parts.append(f'--{self.boundary}\r\ncontent-disposition: form-data; name="{name}"; '
+                          f'filename="{filename}"\r\ncontent-type: {part.input_file.content_type}\r\n\r\n'.encode())
+        self.parts.append(part)
+        self.parts.append(b'\r\n')
+
+    def attach(self, value):
+        """Add file referenced from json field (like InputMedia.media), returns attach:// reference."""
+        name = f'file{len(self.parts)}'
+        self.add_file(name, value)
+        return f'attach://{name}'
+
+    @property
+    def content_type(self):
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def __len__(self):
+        return sum(part.size if isinstance(part, FilePart) else len(part) for part in self.parts)
+
+    def __iter__(self):
+        for part in self.parts:
+            if isinstance(part, FilePart):
+                yield from part.chunks(self.chunk_size)
+            else:
+                yield part
+
+    def write_to(self, sock):
+        """Send body to socket, file parts are sent with zero-copy sendfile.
+
+        socket.sendfile itself falls back to reading file in chunks for tls sockets and not regular files.
+        """
+        for part in self.parts:
+            if isinstance(part, FilePart):
+                try:
+                    sock.sendfile(part.file, part.offset, part.size)
+                finally:
+                    part.rewind()
+            else:
+                sock.sendall(part)
+
+    async def write_to_stream(self, writer):
+        """Send body to asyncio stream, file parts are sent with loop.sendfile (chunked fallback for tls)."""
+        loop = asyncio.get_running_loop()
+        for part in self.parts:
+            if isinstance(part, FilePart):
+                await writer.drain()
+                try:
+                    await loop.sendfile(writer.transport, part.file, part.offset, part.size)
+                finally:
+                    part.rewind()
+            else:
+                writer.write(part)
+        await writer.drain()
+
+    def close(self):
+        for part in self.parts:
+            if isinstance(part, FilePart):
+                part.input_file.close()
+
+
+def encode_field(value, encoder):
+    """Encode non file field as text, files nested in lists and objects (InputMedia.media) are attached."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool) or value is None:
+        return jsonlib.dumps(value)
+    if isinstance(value, (int, float)):
+        return str(value)
+    return jsonlib.dumps(attach_files(value, encoder))
+
+
+def attach_files(value, encoder):
+    if is_file(value):
+        return encoder.attach(value)
+    if isinstance(value, (list, tuple)):
+        return [attach_files(item, encoder) for item in value]
+    if isinstance(value, dict):
+        return {key: attach_files(item, encoder) for key, item in value.items() if item is not None}
+    if isinstance(value, BaseType):
+        # Names like _type are sent without underscore.
+        return {key.lstrip('_'): attach_files(item, encoder) for key, item in value.as_dict().items()
+                if item is not None}
+    return value
+
+
+def has_files(data):
+    """Check if request data contains files, directly or inside InputMedia objects."""
+    for value in data.values():
+        if is_file(value):
+            return True
+        if isinstance(value, (list, tuple)):
+            if any(is_file(getattr(item, 'media', None)) or is_file(getattr(item, 'thumb', None)) for item in value):
+                return True
+        elif is_file(getattr(value, 'media', None)) or is_file(getattr(value, 'thumb', None)):
+            return True
+    return False
@@ -12,6 +12,8 @@ class PassportData(BaseType):
          Encrypted credentials required to decrypt the data
     """
 
+    __slots__ = ('data', 'credentials')
+
     def __init__(self, data,
                  credentials):
         super().__init__()
@@ -34,6 +36,8 @@ class PassportFile(BaseType):
          Unix time when the file was uploaded
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_date')
+
     def __init__(self, file_id,
                  file_unique_id,
                  file_size,
@@ -72,6 +76,9 @@ class EncryptedPassportElement(BaseType):
          Base64-encoded element hash for using in PassportElementErrorUnspecified
     """
 
+    __slots__ = ('type', 'data', 'phone_number', 'email', 'files', 'front_side', 'reverse_side', 'selfie',
+                 'translation', 'hash')
+
     def __init__(self,
                  type,
                  hash,
@@ -109,6 +116,8 @@ class EncryptedCredentials(BaseType):
          Base64-encoded secret, encrypted with the bot's public RSA key, required for data decryption
     """
 
+    __slots__ = ('data', 'hash', 'secret')
+
     def __init__(self, data,
                  hash,
                  secret):
@@ -135,6 +144,8 @@ class PassportElementErrorDataField(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'field_name', 'data_hash', 'message')
+
     def __init__(self, source,
                  type,
                  field_name,
@@ -163,6 +174,8 @@ class PassportElementErrorFrontSide(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+
     def __init__(self,
                  source,
                  type,
@@ -190,6 +203,8 @@ class PassportElementErrorReverseSide(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+
     def __init__(self, source,
                  type,
                  file_hash,
@@ -216,6 +231,8 @@ class PassportElementErrorSelfie(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+
     def __init__(self, source,
                  type,
                  file_hash,
@@ -242,6 +259,8 @@ class PassportElementErrorFile(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+
     def __init__(self, source,
                  type,
                  file_hash,
@@ -268,6 +287,8 @@ class PassportElementErrorFiles(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'file_hashes', 'message')
+
     def __init__(self, source,
                  type,
                  file_hashes,
@@ -294,6 +315,8 @@ class PassportElementErrorTranslationFile(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+
     def __init__(self, source,
                  type,
                  file_hash,
@@ -320,6 +343,8 @@ class PassportElementErrorTranslationFiles(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'file_hashes', 'message')
+
     def __init__(self, source,
                  type,
                  file_hashes,
@@ -346,6 +371,8 @@ class PassportElementErrorUnspecified(BaseType):
          Error message
     """
 
+    __slots__ = ('source', 'type', 'element_hash', 'message')
+
     def __init__(self, source,
                  type,
                  element_hash,
@@ -1,4 +1,5 @@
 from ..methods import BaseMethod
+from ..priority import Priority
 
 
 class sendInvoice(BaseMethod):
@@ -120,6 +121,8 @@ class answerShippingQuery(BaseMethod):
          Required if ok is False. Error message in human readable form that explains why it is impossible to complete the order (e.g. "Sorry, delivery to your desired address is unavailable'). Telegram will display this message to the user.
     """
 
+    priority = Priority.INTERACTIVE
+
     def __init__(self, shipping_query_id,
                  ok,
                  shipping_options=None,
@@ -146,6 +149,8 @@ class answerPreCheckoutQuery(BaseMethod):
          Required if ok is False. Error message in human readable form that explains the reason for failure to proceed with the checkout (e.g. "Sorry, somebody just bought the last of our amazing black T-shirts while you were busy filling out your payment details. Please choose a different color or garment!"). Telegram will display this message to the user.
     """
 
+    priority = Priority.INTERACTIVE
+
     def __init__(self, pre_checkout_query_id,
                  ok,
                  error_message=None,
@@ -13,6 +13,8 @@ class LabeledPrice(BaseType):
          Price of the product in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45 pass amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     """
 
+    __slots__ = ('label', 'amount')
+
     def __init__(self,
                  label,
                  amount):
@@ -38,6 +40,8 @@ class Invoice(BaseType):
          Total price in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45 pass amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     """
 
+    __slots__ = ('title', 'description', 'start_parameter', 'currency', 'total_amount')
+
     def __init__(self,
                  title,
                  description,
@@ -71,6 +75,8 @@ class ShippingAddress(BaseType):
          Address post code
     """
 
+    __slots__ = ('country_code', 'state', 'city', 'street_line1', 'street_line2', 'post_code')
+
     def __init__(self,
                  country_code,
                  state,
@@ -102,6 +108,8 @@ class OrderInfo(BaseType):
          User shipping address
     """
 
+    __slots__ = ('name', 'phone_number', 'email', 'shipping_address')
+
     def __init__(self,
                  name=None,
                  phone_number=None,
@@ -127,6 +135,8 @@ class ShippingOption(BaseType):
          List of price portions
     """
 
+    __slots__ = ('id', 'title', 'prices')
+
     def __init__(self,
                  id,
                  title,
@@ -158,6 +168,9 @@ class SuccessfulPayment(BaseType):
          Provider payment identifier
     """
 
+    __slots__ = ('currency', 'total_amount', 'invoice_payload', 'shipping_option_id', 'order_info',
+                 'telegram_payment_charge_id', 'provider_payment_charge_id')
+
     def __init__(self, currency,
                  total_amount,
                  invoice_payload,
@@ -190,6 +203,8 @@ class ShippingQuery(BaseType):
          User specified shipping address
     """
 
+    __slots__ = ('id', '_from', 'invoice_payload', 'shipping_address')
+
     def __init__(self,
                  id,
                  _from,
@@ -223,6 +238,8 @@ class PreCheckoutQuery(BaseType):
          Order info provided by the user
     """
 
+    __slots__ = ('id', '_from', 'currency', 'total_amount', 'invoice_payload', 'shipping_option_id', 'order_info')
+
     def __init__(self, id,
                  _from,
                  currency,
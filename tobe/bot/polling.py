@@ -0,0 +1,171 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .retry import NETWORK_ERRORS
+from .types import is_failed
+from .updates.methods import getUpdates
+
+
+# Errors after which polling can't continue: wrong token, webhook is set or other poller is running.
+FATAL_ERROR_CODES = (401, 404, 409)
+
+COMMIT_MODES = ('before', 'after')
+
+
+class PollingError(Exception):
+    """getUpdates failed with error which can't be fixed by repeating request."""
+
+    def __init__(self, error):
+        super().__init__(f'getUpdates failed with {error.error_code}: {error.description}')
+        self.error = error
+
+
+class Poller:
+    """Long polling with offset management.
+
+    With commit='before' offset of batch is confirmed before it's processed: next getUpdates request
+    is sent while updates of batch are iterated, so there is no gap between batches, but updates of batch
+    are lost if process crashes during processing. With commit='after' next request is sent
+    (and batch is confirmed) only after all updates of batch are iterated, so updates are redelivered
+    after crash. Pipelining is impossible in this mode: telegram confirms updates only by next request.
+
+    Parameters
+    ----------
+    bot : Bot
+        Bot which executes getUpdates, it's retry policy is applied.
+    timeout : int
+        Long polling timeout in seconds.
+    limit : int, optional
+        Maximum number of updates in batch, 1-100.
+    allowed_updates : list of str, optional
+        Update kinds to receive.
+    offset : int, optional
+        First update id, by default polling starts from first unconfirmed update.
+    commit : str
+        'before' or 'after' processing of batch.
+    lazy : bool
+        Parse LazyUpdate objects.
+    identity_map : IdentityMap, optional
+        Share users and chats between updates.
+    error_delay : float
+        Seconds to wait after failed request, if telegram doesn't ask for other delay.
+    """
+
+    def __init__(self, bot, timeout=30, limit=None, allowed_updates=None, offset=None, commit='before', lazy=False,
+                 identity_map=None, error_delay=5.0):
+        if commit not in COMMIT_MODES:
+            raise ValueError(f'commit must be one of {COMMIT_MODES}, got {commit!r}.')
+        self.bot = bot
+        self.timeout = timeout
+        self.limit = limit
+        self.allowed_updates = allowed_updates
+        self.offset = offset
+        self.commit = commit
+        self.lazy = lazy
+        self.identity_map = identity_map
+        self.error_delay = error_delay
+
+    def make_method(self, offset):
+        return getUpdates(offset=offset, limit=self.limit, timeout=self.timeout, allowed_updates=self.allowed_updates,
+                          lazy=self.lazy, identity_map=self.identity_map)
+
+    def check(self, response):
+        """Updates of response, None if request must be repeated after delay.
+
+        Raises
+        ------
+            PollingError
+                Polling can't continue.
+        """
+        if not is_failed(response):
+            return response
+        if response.error_code in FATAL_ERROR_CODES:
+            raise PollingError(response)
+        return None
+
+    def delay(self, response=None):
+        retry_after = getattr(response, 'retry_after', None)
+        return float(retry_after) if retry_after is not None else self.error_delay
+
+    def advance(self, updates):
+        if updates:
+            self.offset = updates[-1].update_id + 1
+
+    def fetch(self, offset):
+        """Updates starting from offset, failed requests are repeated."""
+        while True:
+            method = self.bot.prepare(self.make_method(offset))
+            try:
+                response = self.bot._execute_one(method)
+            except NETWORK_ERRORS:
+                time.sleep(self.error_delay)
+                continue
+            updates = self.check(response)
+            if updates is not None:
+                return updates
+            time.sleep(self.delay(response))
+
+    def __iter__(self):
+        """Yield updates forever, next request is sent when updates of batch are iterated or in advance."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self.fetch, self.offset)
+            while True:
+                updates = future.result()
+                self.advance(updates)
+                if self.commit == 'before':
+                    future = executor.submit(self.fetch, self.offset)
+                yield from updates
+                if self.commit == 'after':
+                    future = executor.submit(self.fetch, self.offset)
+        finally:
+            # Request in flight is abandoned, it's updates are not confirmed and will be received again.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncPoller(Poller):
+    """Long polling of AsyncBot, same as Poller but iterated with async for."""
+
+    async def fetch(self, offset):
+        while True:
+            method = self.bot.prepare(self.make_method(offset))
+            try:
+                response = await self.bot._execute_one(method)
+            except NETWORK_ERRORS:
+                await asyncio.sleep(self.error_delay)
+                continue
+            updates = self.check(response)
+            if updates is not None:
+                return updates
+            await asyncio.sleep(self.delay(response))
+
+    async def __aiter__(self):
+        task = asyncio.ensure_future(self.fetch(self.offset))
+        try:
+            while True:
+                updates = await task
+                self.advance(updates)
+                if self.commit == 'before':
+                    task = asyncio.ensure_future(self.fetch(self.offset))
+                for update in updates:
+                    yield update
+                if self.commit == 'after':
+                    task = asyncio.ensure_future(self.fetch(self.offset))
+        finally:
+            task.cancel()
+
+
+def run(poller, handler):
+    """Call handler(update) for every update of poller, blocks forever."""
+    for update in poller:
+        handler(update)
+
+
+async def run_async(poller, handler):
+    """Await handler(update) for every update of async poller, handler may be plain function."""
+    async for update in poller:
+        result = handler(update)
+        if inspect.isawaitable(result):
+            await result
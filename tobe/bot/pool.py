@@ -0,0 +1,178 @@
+import select
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import httplib2
+
+
+class PoolTimeout(Exception):
+    """No connection became free in time, it's local error and request was not sent."""
+
+
+class PooledConnection:
+    """Connection wrapper which remembers when connection was opened and last used."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.used_at = self.created_at
+
+    @property
+    def age(self):
+        return time.monotonic() - self.created_at
+
+    @property
+    def idle(self):
+        return time.monotonic() - self.used_at
+
+
+class ConnectionPool:
+    """Bounded thread safe pool of persistent (keep-alive) connections.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of connections checked out at the same time, callers block when pool is exhausted.
+    max_idle : int
+        Maximum number of idle connections kept open between requests, extra connections are closed on release.
+    max_age : float
+        Maximum connection age in seconds, older connections are closed on checkout/release.
+    max_idle_time : float
+        Idle connections unused for longer than this number of seconds are closed on checkout.
+    timeout : float, optional
+        Seconds to wait for free connection, wait forever if None.
+    factory : callable, optional
+        Callable which creates new connection, httplib2.Http by default.
+    """
+
+    def __init__(self, max_size=10,
+                 max_idle=5,
+                 max_age=300.0,
+                 max_idle_time=60.0,
+                 timeout=None,
+                 factory=None):
+        assert max_size > 0, 'max_size must be positive.'
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self.max_idle_time = max_idle_time
+        self.timeout = timeout
+        self.factory = factory or httplib2.Http
+
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+
+        # Counters, useful for benchmarks and debugging.
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self):
+        """Checkout healthy connection from pool or open new one."""
+        assert not self._closed, 'Connection pool is closed.'
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout('Timed out waiting for free connection.')
+
+        try:
+            while True:
+                with self._lock:
+                    pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    break
+                if self.is_healthy(pooled):
+                    self.reused += 1
+                    return pooled
+                self.discard(pooled)
+
+            pooled = PooledConnection(self.factory())
+            self.created += 1
+            return pooled
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, pooled, reuse=True):
+        """Return connection to pool, broken or expired connections must be released with reuse=False."""
+        try:
+            pooled.used_at = time.monotonic()
+            if reuse and not self._closed and pooled.age < self.max_age:
+                with self._lock:
+                    if len(self._idle) < self.max_idle:
+                        self._idle.append(pooled)
+                        return
+            self.discard(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Context manager for checkout, connection is dropped if request raised an exception."""
+        pooled = self.acquire()
+        try:
+            yield pooled.connection
+        except BaseException:
+            self.release(pooled, reuse=False)
+            raise
+        self.release(pooled)
+
+    def is_healthy(self, pooled):
+        """Check connection before checkout: age, idle time and state of it's sockets."""
+        if pooled.age >= self.max_age or pooled.idle >= self.max_idle_time:
+            return False
+        return all(socket_is_alive(sock) for sock in connection_sockets(pooled.connection))
+
+    def discard(self, pooled):
+        self.discarded += 1
+        close = getattr(pooled.connection, 'close', None)
+        if close is not None:
+            try:
+                close()
+            except OSError:
+                pass
+
+    def close(self):
+        """Close all idle connections, pool can't be used after closing."""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for pooled in idle:
+            self.discard(pooled)
+
+
+def connection_sockets(connection):
+    """Get open sockets of connection, supports httplib2.Http and http.client connections."""
+    if hasattr(connection, 'connections'):
+        connections = list(connection.connections.values())
+    else:
+        connections = [connection]
+    return [conn.sock for conn in connections if getattr(conn, 'sock', None) is not None]
+
+
+def socket_is_alive(sock):
+    """Idle keep-alive socket must not be readable, otherwise server closed it or sent garbage.
+
+    Readable socket is alive only if peek returns data: EOF means server closed connection.
+    """
+    try:
+        if not _readable(sock):
+            return True
+        # Peek raw socket, tls sockets can't peek but may have pending records (like session tickets).
+        return bool(socket.socket.recv(sock, 1, socket.MSG_PEEK))
+    except (OSError, ValueError):
+        return False
+
+
+def _readable(sock):
+    if hasattr(select, 'poll'):
+        # select.select fails for descriptors above FD_SETSIZE (1024), busy bots have more.
+        poller = select.poll()
+        poller.register(sock, select.POLLIN | select.POLLPRI)
+        return bool(poller.poll(0))
+    # Windows has no poll, it's select has no descriptor limit.
+    readable, _, _ = select.select([sock], [], [], 0)
+    return bool(readable)
@@ -0,0 +1,194 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """Priority classes of outbound methods, lower value is more urgent."""
+
+    INTERACTIVE = 0 # Answers to users which wait for them: callback, inline and checkout queries.
+    NORMAL = 1
+    BULK = 2 # Broadcasts and other background traffic.
+
+
+DEFAULT_WEIGHTS = {
+    Priority.INTERACTIVE: 16,
+    Priority.NORMAL: 4,
+    Priority.BULK: 1,
+}
+
+
+class WeightedFairQueue:
+    """Stride scheduling between priority classes, FIFO inside class.
+
+    Every class gets share of admissions proportional to it's weight while there is contention,
+    so interactive methods jump ahead of bulk ones, but bulk traffic never starves. Not thread safe.
+
+    Parameters
+    ----------
+    weights : dict, optional
+        Priority -> weight.
+    """
+
+    STRIDE = 1 << 20
+
+    def __init__(self, weights=None):
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self._queues = {priority: deque() for priority in self.weights}
+        self._passes = {priority: 0 for priority in self.weights}
+        self._virtual_time = 0
+
+    def push(self, priority, item):
+        queue = self._queues[priority]
+        if not queue:
+            # Idle class doesn't collect credit, it continues from current virtual time.
+            self._passes[priority] = max(self._passes[priority], self._virtual_time)
+        queue.append(item)
+
+    def pop(self):
+        priority = min((priority for priority, queue in self._queues.items() if queue),
+                       key=lambda priority: (self._passes[priority], priority))
+        self._virtual_time = self._passes[priority]
+        self._passes[priority] += self.STRIDE // self.weights[priority]
+        return self._queues[priority].popleft()
+
+    def size(self, priority=None):
+        if priority is not None:
+            return len(self._queues[priority])
+        return sum(len(queue) for queue in self._queues.values())
+
+    def __len__(self):
+        return self.size()
+
+
+class SendQueue:
+    """Prioritized send queue in front of Bot.execute.
+
+    Methods are admitted to bot by worker threads in weighted fair order of their priority classes.
+
+    Parameters
+    ----------
+    bot : Bot
+        Bot which executes methods.
+    workers : int
+        Number of methods executed at once.
+    weights : dict, optional
+        Priority -> weight, see WeightedFairQueue.
+    maxsize : int
+        Maximum number of waiting methods per priority class, submit blocks when class is full. 0 - unlimited.
+    """
+
+    def __init__(self, bot, workers=8, weights=None, maxsize=0):
+        self.bot = bot
+        self.maxsize = maxsize
+        self._queue = WeightedFairQueue(weights)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, method, priority=None):
+        """Put method into queue.
+
+        Parameters
+        ----------
+            method: BaseMethod
+                Method to execute.
+            priority: Priority, optional
+                Overrides priority of method.
+
+        Returns
+        -------
+            concurrent.futures.Future with method response.
+        """
+        priority = Priority(method.priority if priority is None else priority)
+        future = Future()
+        with self._condition:
+            assert not self._closed, 'Send queue is closed.'
+            while self.maxsize and self._queue.size(priority) >= self.maxsize:
+                self._condition.wait()
+            self._queue.push(priority, (method, future))
+            self._condition.notify_all()
+        return future
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                method, future = self._queue.pop()
+                self._condition.notify_all()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.bot.execute(method))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+    def close(self, wait=True):
+        """Stop accepting methods, workers finish already queued ones."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+class AsyncSendQueue:
+    """Prioritized send queue in front of AsyncBot.execute, same as SendQueue but with worker tasks.
+
+    Must be created inside running event loop.
+    """
+
+    def __init__(self, bot, workers=64, weights=None, maxsize=0):
+        self.bot = bot
+        self.maxsize = maxsize
+        self._queue = WeightedFairQueue(weights)
+        self._condition = asyncio.Condition()
+        self._closed = False
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(workers)]
+
+    async def submit(self, method, priority=None):
+        """Put method into queue, returns asyncio.Future with method response."""
+        priority = Priority(method.priority if priority is None else priority)
+        future = asyncio.get_event_loop().create_future()
+        async with self._condition:
+            assert not self._closed, 'Send queue is closed.'
+            await self._condition.wait_for(lambda: not self.maxsize or self._queue.size(priority) < self.maxsize)
+            self._queue.push(priority, (method, future))
+            self._condition.notify_all()
+        return future
+
+    async def _work(self):
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                method, future = self._queue.pop()
+                self._condition.notify_all()
+
+            if future.cancelled():
+                continue
+            try:
+                response = await self.bot.execute(method)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(response)
+
+    async def close(self):
+        """Stop accepting methods, workers finish already queued ones."""
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        await asyncio.gather(*self._tasks)
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+
+class Limit:
+    """Rate limit in generic cell rate algorithm form, state of limited key is single float - theoretical arrival time.
+
+    Parameters
+    ----------
+    rate : float
+        Allowed requests per second.
+    burst : int
+        Number of requests which can be sent at once after idle period.
+    """
+
+    def __init__(self, rate, burst=1):
+        assert rate > 0 and burst >= 1, 'rate must be positive and burst at least 1.'
+        self.rate = rate
+        self.burst = burst
+        self.interval = 1.0 / rate
+        self.tolerance = (burst - 1) * self.interval
+
+    def earliest(self, tat, now):
+        """Earliest moment when request can be sent for key with provided theoretical arrival time."""
+        return max(now, tat - self.tolerance)
+
+    def advance(self, tat, at):
+        """New theoretical arrival time after request sent at provided moment."""
+        return max(tat, at) + self.interval
+
+
+def is_message_method(method):
+    """Telegram limits are applied to sent messages: send* methods (except chat actions) and forwards."""
+    name = method.method_name
+    return (name.startswith('send') and name != 'sendChatAction') or name == 'forwardMessage'
+
+
+def is_private_chat(chat_id):
+    """Private chats have positive ids, groups and channels - negative ids or @username, ids may be strings."""
+    if isinstance(chat_id, str):
+        try:
+            chat_id = int(chat_id)
+        except ValueError:
+            return False
+    return isinstance(chat_id, int) and chat_id > 0
+
+
+class RateLimiter:
+    """Telegram aware scheduler of outbound requests.
+
+    Keeps global limit and limit per chat, delays request just enough to stay under all of them.
+    Per chat state is one float in dict ordered by last request, idle chats (which already restored
+    full burst) are evicted incrementally: few least recently used chats are checked on every request.
+
+    Parameters
+    ----------
+    global_limit : Limit
+        Limit for all messages of bot, about 30 messages per second.
+    private_limit : Limit
+        Limit for private chat, about 1 message per second.
+    group_limit : Limit
+        Limit for group or channel, about 20 messages per minute.
+    is_limited : callable, optional
+        Predicate which decides if method is limited, by default send* methods and forwardMessage.
+    sweep_batch : int
+        Number of least recently used chats checked for eviction on every request.
+    """
+
+    def __init__(self, global_limit=None,
+                 private_limit=None,
+                 group_limit=None,
+                 is_limited=None,
+                 sweep_batch=4):
+        self.global_limit = global_limit or Limit(30)
+        self.private_limit = private_limit or Limit(1)
+        self.group_limit = group_limit or Limit(20 / 60)
+        self.is_limited = is_limited or is_message_method
+        self.sweep_batch = sweep_batch
+
+        self._global_tat = 0.0
+        # Chat id -> theoretical arrival time, least recently used first. OrderedDict pops from front in O(1),
+        # plain dict slows down as deleted entries pile up before first live one.
+        self._chats = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters.
+        self.delayed = 0
+        self.delayed_seconds = 0.0
+
+    def reserve_chat(self, chat_id):
+        """Reserve send slot in chat.
+
+        Returns
+        -------
+            Seconds which caller must wait before reserving global slot.
+        """
+        if chat_id is None:
+            return 0.0
+        limit = self.private_limit if is_private_chat(chat_id) else self.group_limit
+        with self._lock:
+            now = time.monotonic()
+            tat = self._chats.get(chat_id, 0.0)
+            at = limit.earliest(tat, now)
+            self._chats[chat_id] = limit.advance(tat, at)
+            self._chats.move_to_end(chat_id)
+            self._evict(now, self.sweep_batch)
+            return self._count(at - now)
+
+    def reserve_global(self):
+        """Reserve global send slot.
+
+        Returns
+        -------
+            Seconds which caller must wait before sending request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            at = self.global_limit.earliest(self._global_tat, now)
+            self._global_tat = self.global_limit.advance(self._global_tat, at)
+            return self._count(at - now)
+
+    def _count(self, delay):
+        if delay > 0:
+            self.delayed += 1
+            self.delayed_seconds += delay
+        return delay
+
+    def acquire(self, method):
+        """Block current thread until method can be sent.
+
+        Global slot is reserved only after chat slot is reached, so busy chat doesn't hold back other chats.
+        """
+        if not self.is_limited(method):
+            return
+        for reserve in (lambda: self.reserve_chat(getattr(method, 'chat_id', None)), self.reserve_global):
+            delay = reserve()
+            if delay > 0:
+                time.sleep(delay)
+
+    async def acquire_async(self, method):
+        """Wait without blocking event loop until method can be sent."""
+        if not self.is_limited(method):
+            return
+        for reserve in (lambda: self.reserve_chat(getattr(method, 'chat_id', None)), self.reserve_global):
+            delay = reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def sweep(self):
+        """Evict all chats which theoretical arrival time passed, such chat state equals to state of unknown chat."""
+        with self._lock:
+            self._evict(time.monotonic(), len(self._chats))
+
+    def _evict(self, now, count):
+        # Least recently used chats are checked, still limited ones are moved to the end.
+        chats = self._chats
+        for _ in range(min(count, len(chats))):
+            chat_id, tat = chats.popitem(last=False)
+            if tat > now:
+                chats[chat_id] = tat
+
+    def __len__(self):
+        return len(self._chats)
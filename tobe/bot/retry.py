@@ -0,0 +1,192 @@
+import asyncio
+import http.client
+import random
+import socket
+import threading
+import time
+
+import httplib2
+
+from .types import is_failed
+
+
+# Errors of transport layer, request may be repeated after them. Other OSErrors, like missing file
+# of InputFile, are local and are not repeated. Async transport raises IncompleteReadError on truncated response.
+NETWORK_ERRORS = (ConnectionError, socket.timeout, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                  http.client.HTTPException, httplib2.HttpLib2Error)
+
+
+class RetryStats:
+    """Counters of retry engine, shows how much time goes to throttling and backoff."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self.backoff_seconds = 0.0
+        self.server_errors = 0
+        self.network_errors = 0
+        self.migrations = 0
+        self.exhausted = 0
+        self._lock = threading.Lock()
+
+    def add(self, **counters):
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self):
+        return {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
+
+
+class RetryBudget:
+    """Seconds which may be spent on waiting between retries, shared by all methods of one batch."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.spent = 0.0
+        self._lock = threading.Lock()
+
+    def take(self, seconds):
+        """Take seconds from budget, returns False if budget is not enough."""
+        with self._lock:
+            if self.spent + seconds > self.seconds:
+                return False
+            self.spent += seconds
+            return True
+
+
+class RetryPolicy:
+    """Retry engine for failed method executions.
+
+    On 429 waits exactly retry_after from response parameters, on migrate_to_chat_id repeats request
+    with new chat id, on 5xx and network errors waits jittered exponential backoff.
+
+    Parameters
+    ----------
+    max_retries : int
+        Maximum number of retries of one method.
+    base_delay : float
+        First backoff delay in seconds, doubled on every next retry.
+    max_delay : float
+        Maximum backoff delay in seconds.
+    method_budget : float
+        Maximum seconds spent on waiting between retries of one method.
+    batch_budget : float
+        Maximum seconds spent on waiting between retries of all methods of one execute call.
+    retry_network_errors : bool
+        Repeat requests failed on network level, request may be delivered twice in this case.
+    """
+
+    def __init__(self, max_retries=5,
+                 base_delay=0.5,
+                 max_delay=30.0,
+                 method_budget=60.0,
+                 batch_budget=300.0,
+                 retry_network_errors=True):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.method_budget = method_budget
+        self.batch_budget = batch_budget
+        self.retry_network_errors = retry_network_errors
+        self.stats = RetryStats()
+
+    def new_budget(self):
+        return RetryBudget(self.batch_budget)
+
+    def backoff(self, attempt):
+        """Full jitter exponential backoff."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def next_delay(self, method, attempt, response=None, error=None):
+        """Decide if method must be repeated.
+
+        Returns
+        -------
+            Seconds to wait before next attempt or None if response (or error) is final.
+        """
+        if error is not None:
+            if not self.retry_network_errors:
+                return None
+            self.stats.add(network_errors=1)
+            return self.backoff(attempt)
+
+        if not is_failed(response):
+            return None
+
+        error_code = getattr(response, 'error_code', None)
+        retry_after = getattr(response, 'retry_after', None)
+        migrate_to_chat_id = getattr(response, 'migrate_to_chat_id', None)
+
+        if error_code == 429 and retry_after is not None:
+            self.stats.add(throttled=1)
+            return float(retry_after)
+        if migrate_to_chat_id is not None and getattr(method, 'chat_id', None) != migrate_to_chat_id:
+            # Group was upgraded to supergroup, repeat immediately in new chat.
+            method.chat_id = migrate_to_chat_id
+            self.stats.add(migrations=1)
+            return 0.0
+        if error_code is not None and error_code >= 500:
+            self.stats.add(server_errors=1)
+            return self.backoff(attempt)
+        return None
+
+    def _allow(self, delay, attempt, spent, budget):
+        if attempt >= self.max_retries or spent + delay > self.method_budget or not budget.take(delay):
+            self.stats.add(exhausted=1)
+            return False
+        return True
+
+    def _account(self, response, delay):
+        if getattr(response, 'error_code', None) == 429:
+            self.stats.add(retries=1, throttled_seconds=delay)
+        else:
+            self.stats.add(retries=1, backoff_seconds=delay)
+
+    def call(self, method, send, budget=None):
+        """Execute method with send(method) callable, repeating it while policy allows."""
+        budget = budget or self.new_budget()
+        attempt, spent = 0, 0.0
+        while True:
+            self.stats.add(requests=1)
+            response, error = None, None
+            try:
+                response = send(method)
+            except NETWORK_ERRORS as exc:
+                error = exc
+
+            delay = self.next_delay(method, attempt, response, error)
+            if delay is None or not self._allow(delay, attempt, spent, budget):
+                if error is not None:
+                    raise error
+                return response
+
+            self._account(response, delay)
+            time.sleep(delay)
+            attempt += 1
+            spent += delay
+
+    async def call_async(self, method, send, budget=None):
+        """Same as call, but send(method) is awaitable."""
+        budget = budget or self.new_budget()
+        attempt, spent = 0, 0.0
+        while True:
+            self.stats.add(requests=1)
+            response, error = None, None
+            try:
+                response = await send(method)
+            except NETWORK_ERRORS as exc:
+                error = exc
+
+            delay = self.next_delay(method, attempt, response, error)
+            if delay is None or not self._allow(delay, attempt, spent, budget):
+                if error is not None:
+                    raise error
+                return response
+
+            self._account(response, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+            spent += delay
@@ -0,0 +1,61 @@
+import inspect
+
+from .updates.types import UpdateKind
+
+
+class Router:
+    """Dispatch of updates to handlers by kind of update.
+
+    Handlers are kept in table indexed by UpdateKind, which is set on parse,
+    so dispatch doesn't probe update fields. Handlers of kind are tried in order
+    of registration, first one which filter accepts update handles it.
+
+    Parameters
+    ----------
+    fallback : callable, optional
+        Called with updates which no handler accepted.
+    """
+
+    def __init__(self, fallback=None):
+        self.fallback = fallback
+        self._handlers = [[] for _ in UpdateKind] # kind -> [(filter, handler)]
+
+    def add(self, kind, handler, filter=None):
+        """Register handler(update) for updates of kind, filter(update) may reject update."""
+        self._handlers[UpdateKind(kind)].append((filter, handler))
+        return handler
+
+    def on(self, kind, filter=None):
+        """Decorator which registers handler, like @router.on(UpdateKind.MESSAGE)."""
+        def decorator(handler):
+            return self.add(kind, handler, filter)
+        return decorator
+
+    def resolve(self, update):
+        """Handler of update, fallback if no handler accepts it."""
+        for filter, handler in self._handlers[update.kind]:
+            if filter is None or filter(update):
+                return handler
+        return self.fallback
+
+    def dispatch(self, update):
+        """Call handler of update.
+
+        Returns
+        -------
+            Result of handler, None if there is no handler.
+        """
+        handler = self.resolve(update)
+        if handler is None:
+            return None
+        return handler(update)
+
+    async def dispatch_async(self, update):
+        """Same as dispatch, handlers may be coroutine functions."""
+        handler = self.resolve(update)
+        if handler is None:
+            return None
+        result = handler(update)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
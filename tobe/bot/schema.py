@@ -0,0 +1,106 @@
+import ast
+import inspect
+import sys
+import textwrap
+
+
+class Field:
+    """Attribute of type, read from it's constructor.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name, like _from.
+    param : str
+        Constructor parameter, same as field name in response after fix_built_ins.
+    type_name : str, optional
+        Name of nested type which parses value, like User for X.parse(value).
+    iterable : bool
+        Value is array of nested types.
+    default :
+        Default value of constructor parameter, None for required ones.
+    """
+
+    __slots__ = ('name', 'param', 'type_name', 'iterable', 'default', 'owner')
+
+    def __init__(self, name, param, type_name=None, iterable=False, default=None, owner=None):
+        self.name = name
+        self.param = param
+        self.type_name = type_name
+        self.iterable = iterable
+        self.default = default
+        self.owner = owner
+
+    @property
+    def type(self):
+        """Nested type class, resolved lazily because types may be defined after type which uses them."""
+        if self.type_name is None:
+            return None
+        return getattr(sys.modules[self.owner.__module__], self.type_name)
+
+    @property
+    def wire_name(self):
+        """Field name in telegram json, like from for _from."""
+        return wire_name(self.param)
+
+
+def wire_name(name):
+    """Field name in telegram json for attribute or parameter name, like from for _from."""
+    return name[1:] if name in ('_from', '_type') else name
+
+
+_fields = {}
+
+
+def type_fields(cls):
+    """Get fields of type from assignments in it's __init__.
+
+    Supported are assignments of parameters as is (self.x = x) and parsed with nested type
+    (self.x = X.parse(x) or X.parse(x, iterable=True)).
+
+    Returns
+    -------
+        Tuple of Field or None if constructor does something else.
+    """
+    if cls in _fields:
+        return _fields[cls]
+
+    fields = None
+    init = cls.__dict__.get('__init__')
+    if init is not None:
+        try:
+            source = textwrap.dedent(inspect.getsource(init))
+        except (OSError, TypeError):
+            source = None
+        if source is not None:
+            fields = _parse_init(cls, ast.parse(source).body[0], inspect.signature(init))
+    _fields[cls] = fields
+    return fields
+
+
+def _parse_init(cls, node, signature):
+    fields = []
+    for statement in node.body:
+        if isinstance(statement, ast.Expr) and isinstance(statement.value, (ast.Call, ast.Constant)):
+            # super().__init__() and docstrings.
+            continue
+        if not (isinstance(statement, ast.Assign) and len(statement.targets) == 1):
+            return None
+        target, value = statement.targets[0], statement.value
+        if not (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == 'self'):
+            return None
+
+        type_name, iterable = None, False
+        if isinstance(value, ast.Call) and isinstance(value.func, ast.Attribute) and value.func.attr == 'parse' \
+                and isinstance(value.func.value, ast.Name) and len(value.args) == 1:
+            type_name = value.func.value.id
+            iterable = any(keyword.arg == 'iterable' and isinstance(keyword.value, ast.Constant) and keyword.value.value
+                           for keyword in value.keywords)
+            value = value.args[0]
+        if not (isinstance(value, ast.Name) and value.id in signature.parameters):
+            return None
+
+        default = signature.parameters[value.id].default
+        fields.append(Field(target.attr, value.id, type_name, iterable,
+                            None if default is inspect.Parameter.empty else default, cls))
+    return tuple(fields)
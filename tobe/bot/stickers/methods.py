@@ -1,4 +1,6 @@
 from ..methods import BaseMethod
+from ..base.types import Message
+from .types import StickerSet
 
 
 class sendSticker(BaseMethod):
@@ -18,6 +20,8 @@ class sendSticker(BaseMethod):
          Additional interface options. A JSON-serialized object for an inline keyboard, custom reply keyboard, instructions to remove reply keyboard or to force a reply from the user.
     """
 
+    response_type = Message
+
     def __init__(self,
                  chat_id,
                  sticker,
@@ -43,6 +47,10 @@ class getStickerSet(BaseMethod):
          Name of the sticker set
     """
 
+    response_type = StickerSet
+    cache_ttl = 60
+    read_only = True
+
     def __init__(self,
                  name,
                  propagate_values: bool = False,
@@ -136,6 +144,8 @@ class addStickerToSet(BaseMethod):
          A JSON-serialized object for position where the mask should be placed on faces
     """
 
+    invalidates = ('getStickerSet',)
+
     def __init__(self, user_id,
                  name,
                  emojis,
@@ -164,6 +174,9 @@ class setStickerPositionInSet(BaseMethod):
          New sticker position in the set, zero-based
     """
 
+    # Sticker set name is unknown, all cached sticker sets are dropped.
+    invalidates = ('getStickerSet',)
+
     def __init__(self,
                  sticker,
                  position,
@@ -183,6 +196,9 @@ class deleteStickerFromSet(BaseMethod):
          File identifier of the sticker
     """
 
+    # Sticker set name is unknown, all cached sticker sets are dropped.
+    invalidates = ('getStickerSet',)
+
     def __init__(self,
                  sticker,
                  propagate_values: bool = False,
@@ -204,6 +220,8 @@ class setStickerSetThumb(BaseMethod):
          A PNG image with the thumbnail, must be up to 128 kilobytes in size and have width and height exactly 100px, or a TGS animation with the thumbnail up to 32 kilobytes in size; see https://core.telegram.org/animated_stickers#technical-requirements for animated sticker technical requirements. Pass a file_id as a String to send a file that already exists on the Telegram servers, pass an HTTP URL as a String for Telegram to get a file from the Internet, or upload a new one using multipart/form-data. More info on Sending Files �. Animated sticker set thumbnail can't be uploaded via HTTP URL.
     """
 
+    invalidates = ('getStickerSet',)
+
     def __init__(self,
                  name,
                  user_id,
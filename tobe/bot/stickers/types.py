@@ -29,6 +29,9 @@ class Sticker(BaseType):
          File size
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'is_animated', 'thumb', 'emoji', 'set_name',
+                 'mask_position', 'file_size')
+
     def __init__(self, file_id,
                  file_unique_id,
                  width,
@@ -71,6 +74,8 @@ class StickerSet(BaseType):
          Sticker set thumbnail in the .WEBP or .TGS format
     """
 
+    __slots__ = ('name', 'title', 'is_animated', 'contains_masks', 'stickers', 'thumb')
+
     def __init__(self, name,
                  title,
                  is_animated,
@@ -101,6 +106,8 @@ class MaskPosition(BaseType):
          Mask scaling coefficient. For example, 2.0 means double size.
     """
 
+    __slots__ = ('point', 'x_shift', 'y_shift', 'scale')
+
     def __init__(self, point,
                  x_shift,
                  y_shift,
@@ -0,0 +1,115 @@
+import re
+
+from . import jsonlib
+
+
+# Bracket with everything up to next bracket, strings (which may contain brackets) are skipped as whole.
+_brackets = re.compile(rb'[\[\]{}](?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.S)
+_opening = frozenset(b'[{')
+_scalar = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[^,\]}\s]+', re.S)
+_whitespace = re.compile(rb'[ \t\n\r]*')
+
+
+def _skip(content, pos, expected=None):
+    # Skip whitespaces and expected delimiter after them.
+    pos = _whitespace.match(content, pos).end()
+    if expected is not None:
+        if content[pos:pos + 1] != expected:
+            raise ValueError(f'Expecting {expected.decode()!r} at char {pos}')
+        pos = _whitespace.match(content, pos + 1).end()
+    return pos
+
+
+def _value_end(content, pos):
+    # End of json value which starts at pos, nested values are only scanned, not decoded.
+    if content[pos:pos + 1] not in (b'{', b'['):
+        match = _scalar.match(content, pos)
+        if match is None:
+            raise ValueError(f'Expecting value at char {pos}')
+        return match.end()
+    depth = 0
+    for match in _brackets.finditer(content, pos):
+        start = match.start()
+        if content[start] in _opening:
+            depth += 1
+        else:
+            depth -= 1
+            if not depth:
+                return start + 1
+    raise ValueError(f'Unterminated value at char {pos}')
+
+
+def iter_array(content, key='result'):
+    """Decode items of array under key of top level json object one by one.
+
+    Response is scanned for bounds of items without decoding, every item is decoded separately
+    with jsonlib when it's reached. So whole array is never kept in memory decoded and first item
+    is available before the rest of response is decoded.
+    Nothing is yielded if there is no such key.
+
+    Raises
+    ------
+        ValueError
+            Content is not valid json, raised when invalid part is reached.
+    """
+    if isinstance(content, str):
+        content = content.encode()
+    pos = _skip(content, 0, b'{')
+    if content[pos:pos + 1] == b'}':
+        return
+    name = jsonlib.dumpb(key)
+    while True:
+        end = _value_end(content, pos)
+        is_key = content[pos:end] == name
+        pos = _skip(content, end, b':')
+        if is_key and content[pos:pos + 1] == b'[':
+            pos = _skip(content, pos + 1)
+            if content[pos:pos + 1] == b']':
+                return
+            while True:
+                end = _value_end(content, pos)
+                yield jsonlib.loads(content[pos:end])
+                pos = _skip(content, end)
+                if content[pos:pos + 1] == b']':
+                    return
+                pos = _skip(content, pos, b',')
+
+        pos = _skip(content, _value_end(content, pos))
+        if content[pos:pos + 1] == b'}':
+            return
+        pos = _skip(content, pos, b',')
+
+
+class ResponseStream:
+    """Iterator over items of array response, each item is decoded into type when it's reached.
+
+    Stream can be iterated only once and must not be shared between callers,
+    so methods with streamed responses are never cached or coalesced.
+
+    Parameters
+    ----------
+    content : bytes
+        Response body.
+    decoder : callable
+        Builds type instance from decoded item, like get_decoder(Update).
+    """
+
+    def __init__(self, content, decoder):
+        self._items = iter_array(content)
+        self._decoder = decoder
+        self._callbacks = []
+        self.consumed = 0
+
+    def add_callback(self, callback):
+        """Call callback(item) with every item when it's iterated, like propagation of update_id to bot."""
+        self._callbacks.append(callback)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = self._decoder(next(self._items))
+        self.consumed += 1
+        for callback in self._callbacks:
+            callback(item)
+        return item
@@ -0,0 +1,66 @@
+from . import encoders
+from .multipart import has_files
+from .schema import wire_name
+
+
+class MethodTemplate:
+    """Method with request body encoded once, for sending same method to many chats.
+
+    Invariant part of body (text, reply_markup and so on) is encoded on creation,
+    per request only variable fields are encoded and spliced into it as bytes.
+
+    Parameters
+    ----------
+    method : BaseMethod
+        Method which is sent, values of variable fields are ignored.
+    fields : tuple of str
+        Variable fields, set for every request.
+
+    Raises
+    ------
+        ValueError
+            Method has files or isn't sent with json body.
+    """
+
+    def __init__(self, method, fields=('chat_id',)):
+        if method.http_method != 'GET':
+            raise ValueError('Only methods with json body can be templated.')
+        self.method = method
+        self.fields = tuple(fields)
+
+        data = {key: value for key, value in method.__dict__.items()
+                if value is not None and key not in method.local_fields and key not in self.fields}
+        if has_files(data):
+            raise ValueError('Methods with files can\'t be templated, upload file once and send it\'s file_id.')
+        self._keys = tuple(encoders.dumpb(wire_name(field)) + b':' for field in self.fields)
+        # Invariant fields without braces, empty if there are none.
+        self._body = encoders.dumpb(data)[1:-1]
+
+    def bind(self, **values):
+        """Method with template body and variable fields set from values.
+
+        Raises
+        ------
+            TypeError
+                Value of field which isn't variable is provided.
+        """
+        for field in values:
+            if field not in self.fields:
+                raise TypeError(f'{field!r} is not variable field of template, fields are {self.fields}.')
+        method = object.__new__(self.method.__class__)
+        method.__dict__.update(self.method.__dict__)
+        method.__dict__.update(values)
+        method.template = self
+        return method
+
+    def render(self, method):
+        """Request body of bound method, variable fields are read from it."""
+        parts = []
+        for field, key in zip(self.fields, self._keys):
+            value = getattr(method, field, None)
+            if value is not None:
+                # Chat ids are encoded without dispatch.
+                parts.append(key + (int.__repr__(value).encode() if value.__class__ is int else encoders.dumpb(value)))
+        if self._body:
+            parts.append(self._body)
+        return b'{' + b','.join(parts) + b'}'
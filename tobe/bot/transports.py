@@ -0,0 +1,211 @@
+from abc import ABC, abstractmethod
+import asyncio
+import http.client
+import threading
+import time
+from urllib.parse import urlsplit, parse_qsl
+
+from . import jsonlib
+from .multipart import MultipartEncoder
+from .pool import ConnectionPool
+
+
+class StaleConnection(Exception):
+    """Reused keep-alive connection was closed by server before request was received."""
+
+
+class Transport(ABC):
+    """Blocking http transport, owned by Bot and shared by all executed methods."""
+
+    @abstractmethod
+    def request(self, method, url, body=None, headers=None):
+        """Send request and read whole response.
+
+        Returns
+        -------
+            Tuple (status, content), where content is bytes.
+        """
+
+    def close(self):
+        """Release transport resources."""
+
+
+class AsyncTransport(ABC):
+    """Non-blocking http transport, owned by AsyncBot and shared by all executed methods."""
+
+    @abstractmethod
+    async def request(self, method, url, body=None, headers=None):
+        """Send request and read whole response.
+
+        Returns
+        -------
+            Tuple (status, content), where content is bytes.
+        """
+
+    async def close(self):
+        """Release transport resources."""
+
+
+class Httplib2Transport(Transport):
+    """Transport over pooled httplib2.Http instances.
+
+    Parameters
+    ----------
+    pool : ConnectionPool, optional
+        Pool of httplib2.Http connections, default pool is created if not provided.
+    """
+
+    def __init__(self, pool=None):
+        self.pool = pool or ConnectionPool()
+
+    def request(self, method, url, body=None, headers=None):
+        with self.pool.connection() as http:
+            resp, content = http.request(url, method=method, body=body, headers=headers)
+        return int(resp['status']), content
+
+    def close(self):
+        self.pool.close()
+
+
+class HTTPClientTransport(Transport):
+    """Transport over stdlib http.client connections, pooled per host.
+
+    Has less overhead than httplib2 (no cache, auth and redirect handling), good choice for throughput.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Socket timeout in seconds.
+    ssl_context : ssl.SSLContext, optional
+        Context for https connections, default context is used if not provided.
+    pool_options :
+        Options of ConnectionPool created for every host, like max_size and max_idle.
+    """
+
+    def __init__(self, timeout=None, ssl_context=None, **pool_options):
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.pool_options = pool_options
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def get_pool(self, scheme, netloc):
+        key = (scheme, netloc)
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = self._pools[key] = ConnectionPool(
+                        factory=lambda: self.connect(scheme, netloc), **self.pool_options)
+        return pool
+
+    def connect(self, scheme, netloc):
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def request(self, method, url, body=None, headers=None):
+        parts = urlsplit(url)
+        pool = self.get_pool(parts.scheme, parts.netloc)
+        path = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+
+        while True:
+            pooled = pool.acquire()
+            reused = pooled.connection.sock is not None
+            try:
+                try:
+                    if isinstance(body, MultipartEncoder):
+                        # Only head is sent by http.client, files go to socket with sendfile.
+                        pooled.connection.request(method, path, headers=headers)
+                        body.write_to(pooled.connection.sock)
+                    else:
+                        pooled.connection.request(method, path, body=body, headers=headers or {})
+                except (BrokenPipeError, ConnectionResetError):
+                    if reused:
+                        raise StaleConnection
+                    raise
+                try:
+                    response = pooled.connection.getresponse()
+                except http.client.RemoteDisconnected:
+                    if reused:
+                        raise StaleConnection
+                    raise
+                content = response.read()
+            except StaleConnection:
+                # Server closed idle keep-alive connection before reading request, repeat on fresh connection.
+                # Other errors (like timeout) are not repeated, request may be received already.
+                pool.release(pooled, reuse=False)
+                continue
+            except BaseException:
+                pool.release(pooled, reuse=False)
+                raise
+            pool.release(pooled, reuse=not response.will_close)
+            return response.status, content
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.close()
+
+
+class FakeTransport(Transport):
+    """In-memory transport which answers like telegram api, for tests and benchmarks.
+
+    Parameters
+    ----------
+    results : dict, optional
+        Method name -> result payload, or callable(params) which returns result payload
+        or tuple (status, response dict) for errors. True is answered for unknown methods.
+    latency : float
+        Seconds to wait before every answer, simulates network round trip.
+    """
+
+    def __init__(self, results=None, latency=0.0):
+        self.results = dict(results or {})
+        self.latency = latency
+        self.requests = []
+
+    def respond(self, method, url, body=None, headers=None):
+        method_name = urlsplit(url).path.rsplit('/', 1)[-1]
+        params = decode_body(body)
+        self.requests.append((method_name, params))
+
+        result = self.results.get(method_name, True)
+        if callable(result):
+            result = result(params)
+        if isinstance(result, tuple):
+            status, response = result
+        else:
+            status, response = 200, {'ok': True, 'result': result}
+        return status, jsonlib.dumpb(response)
+
+    def request(self, method, url, body=None, headers=None):
+        if self.latency:
+            time.sleep(self.latency)
+        return self.respond(method, url, body, headers)
+
+
+class AsyncFakeTransport(FakeTransport, AsyncTransport):
+    """Non-blocking version of FakeTransport."""
+
+    async def request(self, method, url, body=None, headers=None):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.respond(method, url, body, headers)
+
+    async def close(self):
+        pass
+
+
+def decode_body(body):
+    """Decode json, urlencoded or multipart request body into dict, files are replaced with their names."""
+    if isinstance(body, MultipartEncoder):
+        return {**body.fields, **body.files}
+    if not body:
+        return {}
+    try:
+        return jsonlib.loads(body)
+    except ValueError:
+        return dict(parse_qsl(body.decode() if isinstance(body, bytes) else body))
@@ -1,34 +1,70 @@
 from abc import ABC
-import json
 
-from .services import fix_built_ins
 
 
 class BaseType(ABC):
 
+    __slots__ = ()
+
     status = True
 
+    # Names of all attributes of type, filled for every subclass from __slots__ of it and it's parents.
+    _fields = ()
+    # Slots which are computed on parse by _after_parse, they are not fields of telegram object.
+    _derived = ()
+    # Called with decoded json (or values of fields) after instance is parsed, see Update.
+    _after_parse = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ())
+                            if not name.startswith('__') and name not in cls._derived)
+
+    def as_dict(self):
+        """Attributes of type instance, types are compact slotted objects without __dict__."""
+        return {name: getattr(self, name, None) for name in self._fields}
+
     def serialize(self):
-        return json.dumps(self.__dict__)
+        # Imported here, encoders depend on this module.
+        from .encoders import dumps
+
+        return dumps(self)
 
     @classmethod
     def parse(cls, response, iterable=False):
-        """Parse data from response, fix built in names
+        """Parse data from response with generated decoder of type, fix built in names
 
             Returns:
                 Type instance.
         """
-        if iterable:
-            return [cls(**fix_built_ins(part)) for part in response] if response else None
-        else:
-            return cls(**fix_built_ins(response)) if response else None
+        # Imported here, decoders depend on this module.
+        from .decoders import decode
+
+        return decode(cls, response, iterable)
 
 class Error(BaseType):
     """Error type class."""
 
-    status = False
+    __slots__ = ('status', 'error_code', 'description', 'parameters')
+
+    def __init__(self, ok, error_code, description, parameters=None):
+        # Imported here, base types depend on this module.
+        from .base.types import Parameters
 
-    def __init__(self, ok, error_code, description):
         self.status = ok
         self.error_code = error_code
-        self.description = description
\ No newline at end of file
+        self.description = description
+        self.parameters = Parameters.parse(parameters)
+
+    @property
+    def retry_after(self):
+        return self.parameters.retry_after if self.parameters else None
+
+    @property
+    def migrate_to_chat_id(self):
+        return self.parameters.migrate_to_chat_id if self.parameters else None
+
+
+def is_failed(response):
+    """Check execution result, methods may answer with plain values (like True) which have no status."""
+    return getattr(response, 'status', True) == False
@@ -17,6 +17,12 @@ class getUpdates(BaseMethod):
          Timeout in seconds for long polling. Defaults to 0, i.e. usual short polling. Should be positive, short polling should be used for testing purposes only.
     allowed_updates : Array of String, optional
          A JSON-serialized list of the update types you want your bot to receive. For example, specify [�message�, �edited_channel_post�, �callback_query�] to only receive updates of these types. See Update for a complete list of available update types. Specify an empty list to receive all updates regardless of type (default). If not specified, the previous setting will be used.Please note that this parameter doesn't affect updates created before the call to the getUpdates, so unwanted updates may be received for a short period of time.
+    lazy : Boolean, optional
+         Return LazyUpdate objects, which build nested objects on first attribute access.
+    stream : Boolean, optional
+         Return ResponseStream of updates, which decodes updates one by one while it's iterated.
+    identity_map : IdentityMap, optional
+         Share repeated users and chats between updates of this and next responses parsed with same map.
     """
 
     response_type = [Update]
@@ -25,6 +31,9 @@ class getUpdates(BaseMethod):
                  limit: int = None,
                  timeout: int = None,
                  allowed_updates=None,
+                 lazy: bool = False,
+                 stream: bool = False,
+                 identity_map=None,
                  propagate_values: bool = False,
                  propagate_fields: dict = None):
         super().__init__(propagate_values=propagate_values, propagate_fields=propagate_fields)
@@ -32,6 +41,12 @@ class getUpdates(BaseMethod):
         self.limit = limit
         self.timeout = timeout
         self.allowed_updates = allowed_updates
+        if lazy:
+            self.lazy = True
+        if stream:
+            self.stream = True
+        if identity_map is not None:
+            self.identity_map = identity_map
 
 
 class setWebhook(BaseMethod):
@@ -1,8 +1,48 @@
+from enum import IntEnum
+
 from ..types import BaseType
+from ..lazy import lazy_type
 from ..base.types import Message, Poll, PollAnswer, CallbackQuery
 from ..inline.types import InlineQuery, ChosenInlineResult
 
 
+class UpdateKind(IntEnum):
+    """Kind of update payload, value is index in handler tables of Router."""
+
+    UNKNOWN = 0 # Payload of newer api version or no payload.
+    MESSAGE = 1
+    EDITED_MESSAGE = 2
+    CHANNEL_POST = 3
+    EDITED_CHANNEL_POST = 4
+    INLINE_QUERY = 5
+    CHOSEN_INLINE_RESULT = 6
+    CALLBACK_QUERY = 7
+    SHIPPING_QUERY = 8
+    PRE_CHECKOUT_QUERY = 9
+    POLL = 10
+    POLL_ANSWER = 11
+
+    @property
+    def field(self):
+        """Update field with payload of this kind, None for unknown."""
+        return self.name.lower() if self else None
+
+
+# Payload field -> kind.
+_KINDS = {kind.field: kind for kind in UpdateKind if kind}
+_MESSAGE_KINDS = frozenset((UpdateKind.MESSAGE, UpdateKind.EDITED_MESSAGE, UpdateKind.CHANNEL_POST,
+                            UpdateKind.EDITED_CHANNEL_POST))
+
+
+def _get(value, name):
+    # Payload is decoded json or already built object, where from is _from.
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, '_from' if name == 'from' else name, None)
+
+
 class Update(BaseType):
     """This object represents an incoming update.At most one of the optional parameters can be present in any given update.
 
@@ -32,8 +72,23 @@ class Update(BaseType):
          New poll state. Bots receive only updates about stopped polls and polls, which are sent by the bot
     poll_answer : PollAnswer, optional
          A user changed their answer in a non-anonymous poll. Bots receive new votes only in polls that were sent by the bot itself.
+
+    Kind of payload and ids of it's chat and user are set on parse:
+
+    kind : UpdateKind
+         Kind of payload, UNKNOWN if update has none of known payloads.
+    chat_id : Integer
+         Chat of message, channel post or message of callback query, None for other kinds.
+    user_id : Integer
+         User who sent message, query or poll answer, None for channel posts and polls.
     """
 
+    __slots__ = ('update_id', 'message', 'edited_message', 'channel_post', 'edited_channel_post', 'inline_query',
+                 'chosen_inline_result', 'callback_query', 'shipping_query', 'pre_checkout_query', 'poll', 'poll_answer',
+                 'kind', 'chat_id', 'user_id')
+
+    _derived = ('kind', 'chat_id', 'user_id')
+
     def __init__(self,
                  update_id,
                  message=None,
@@ -60,14 +115,43 @@ class Update(BaseType):
         self.pre_checkout_query = pre_checkout_query
         self.poll = Poll.parse(poll)
         self.poll_answer = PollAnswer.parse(poll_answer)
+        self._after_parse(locals())
+
+    def _after_parse(self, data):
+        # Payloads are read from decoded json, so lazy updates don't build them.
+        self.kind, self.chat_id, self.user_id = UpdateKind.UNKNOWN, None, None
+        for field, payload in data.items():
+            kind = _KINDS.get(field)
+            if kind is not None and payload is not None:
+                break
+        else:
+            return
+        self.kind = kind
+        if kind in _MESSAGE_KINDS:
+            self.chat_id = _get(_get(payload, 'chat'), 'id')
+        elif kind == UpdateKind.CALLBACK_QUERY:
+            self.chat_id = _get(_get(_get(payload, 'message'), 'chat'), 'id')
+        self.user_id = _get(_get(payload, 'user' if kind == UpdateKind.POLL_ANSWER else 'from'), 'id')
+
+    @property
+    def payload(self):
+        """Message, query or other payload of update."""
+        return getattr(self, self.kind.field) if self.kind else None
 
     def get_offset(self):
         return self.update_id
 
 
+# Update which keeps decoded payload and builds message, users, chats and other nested objects on first access.
+LazyUpdate = lazy_type(Update)
+
+
 class WebhookInfo(BaseType):
     """Contains information about the current status of a webhook. """
 
+    __slots__ = ('url', 'has_custom_certificate', 'pending_update_count', 'last_error_date', 'last_error_message',
+                 'max_connections', 'allowed_updates')
+
     def __init__(self,
                  url: str,
                  has_custom_certificate: bool,
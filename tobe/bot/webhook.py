@@ -0,0 +1,253 @@
+import asyncio
+import inspect
+import secrets
+
+from . import jsonlib
+from .decoders import get_decoder
+from .methods import BaseMethod
+from .updates.types import Update, LazyUpdate
+
+
+REASONS = {200: b'OK', 400: b'Bad Request', 404: b'Not Found', 405: b'Method Not Allowed', 411: b'Length Required',
+           413: b'Payload Too Large'}
+
+
+class WebhookStats:
+    """Counters of webhook server."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self.updates = 0
+        self.rejected = 0
+        self.errors = 0
+        self.replies = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class WebhookServer:
+    """Receiving side of setWebhook: minimal asyncio HTTP/1.1 server which turns POSTed updates into Update objects.
+
+    Updates are accepted only on secret path, which must be set as path of webhook url.
+    Every update is handled while telegram waits for response, at most max_connections at once:
+    when all slots are busy, requests wait for free slot and are answered later, so telegram slows down.
+    Exceptions of handler are passed to on_error and update is answered as handled,
+    otherwise telegram would deliver it again and again. Server is plain HTTP,
+    TLS is terminated by ssl_context or by reverse proxy.
+
+    Handler may return BaseMethod, like sendMessage reply, which is sent in response body
+    and executed by telegram without separate request. It's result is not returned,
+    other calls are executed by bot as usual. Methods with files can't be sent in response,
+    they are executed by bot after response.
+
+    Parameters
+    ----------
+    handler : callable
+        Called with Update, like Router.dispatch_async, may return awaitable. Result may be BaseMethod.
+    path : str, optional
+        Secret path of webhook url, random one is generated if not provided.
+    host : str
+    port : int
+    max_connections : int
+        Maximum number of updates handled at once, same as max_connections of setWebhook.
+    max_body_size : int
+        Requests with larger body are rejected.
+    lazy : bool
+        Parse LazyUpdate objects.
+    identity_map : IdentityMap, optional
+        Share users and chats between updates.
+    ssl_context : ssl.SSLContext, optional
+        Context for https, for self-signed certificate uploaded with setWebhook.
+    on_error : callable, optional
+        Called with (update, exception) for exceptions of handler, loop exception handler is used by default.
+    bot : AsyncBot, optional
+        Executes returned methods which can't be sent in response.
+    """
+
+    def __init__(self, handler, path=None, host='0.0.0.0', port=8443, max_connections=40, max_body_size=1024 * 1024,
+                 lazy=False, identity_map=None, ssl_context=None, on_error=None, bot=None):
+        self.handler = handler
+        self.bot = bot
+        self.path = path or '/' + secrets.token_urlsafe(32)
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.max_body_size = max_body_size
+        self.ssl_context = ssl_context
+        self.on_error = on_error
+        self.decoder = get_decoder(LazyUpdate if lazy else Update, identity_map)
+        self.stats = WebhookStats()
+
+        self._path = self.path.encode()
+        self._slots = None
+        self._server = None
+        self._connections = {} # task -> writer
+        self._busy = set() # tasks of connections which request is being handled
+        self._closing = False
+        self._calls = set() # tasks of methods executed by bot
+
+    @property
+    def sockets(self):
+        return self._server.sockets if self._server else ()
+
+    async def start(self):
+        """Start listening, port 0 takes free port, see sockets."""
+        self._slots = asyncio.Semaphore(self.max_connections)
+        self._closing = False
+        self._server = await asyncio.start_server(self._serve, self.host, self.port, ssl=self.ssl_context)
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop server, requests in progress are answered first, otherwise telegram would deliver them again."""
+        if self._server is not None:
+            self._server.close()
+            self._closing = True
+            # Idle keep-alive connections are closed, busy ones are closed after response.
+            for task, writer in self._connections.items():
+                if task not in self._busy:
+                    writer.transport.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await asyncio.gather(*self._calls, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _serve(self, reader, writer):
+        self.stats.connections += 1
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                self.stats.requests += 1
+                self._busy.add(task)
+                status, keep_alive, body = await self._request(reader, head)
+                keep_alive = keep_alive and not self._closing
+                writer.write(b'HTTP/1.1 %d %s\r\n%sContent-Length: %d\r\n%s\r\n%s'
+                             % (status, REASONS[status], b'Content-Type: application/json\r\n' if body else b'',
+                                len(body), b'' if keep_alive else b'Connection: close\r\n', body))
+                await writer.drain()
+                self._busy.discard(task)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            self._busy.discard(task)
+            self._connections.pop(task, None)
+            writer.close()
+
+    async def _request(self, reader, head):
+        """Read body and handle request, returns response status, keep-alive flag and response body."""
+        request_line, _, header_lines = head[:-4].partition(b'\r\n')
+        try:
+            method, target, version = request_line.split(b' ', 2)
+        except ValueError:
+            return 400, False, b''
+        headers = {}
+        for line in header_lines.split(b'\r\n'):
+            name, _, value = line.partition(b':')
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = version == b'HTTP/1.1' and headers.get(b'connection', b'').lower() != b'close'
+
+        if b'transfer-encoding' in headers:
+            # Telegram always sends Content-Length, chunked bodies are not supported.
+            return 411, False, b''
+        try:
+            length = int(headers.get(b'content-length', 0))
+        except ValueError:
+            return 400, False, b''
+        if length > self.max_body_size:
+            return 413, False, b''
+        try:
+            body = await reader.readexactly(length)
+        except asyncio.IncompleteReadError:
+            return 400, False, b''
+
+        if target.split(b'?', 1)[0] != self._path:
+            self.stats.rejected += 1
+            return 404, keep_alive, b''
+        if method != b'POST':
+            return 405, keep_alive, b''
+        try:
+            update = self.decoder(jsonlib.loads(body))
+        except (ValueError, TypeError, AttributeError):
+            self.stats.rejected += 1
+            return 400, keep_alive, b''
+
+        result = await self.handle(update)
+        if isinstance(result, BaseMethod):
+            return 200, keep_alive, self.reply(update, result)
+        return 200, keep_alive, b''
+
+    async def handle(self, update):
+        stats = self.stats
+        async with self._slots:
+            stats.updates += 1
+            stats.in_flight += 1
+            stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+            try:
+                result = self.handler(update)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as exc:
+                stats.errors += 1
+                self.report(update, exc)
+                result = None
+            finally:
+                stats.in_flight -= 1
+        return result
+
+    def reply(self, update, method):
+        """Response body which calls method, empty if method is executed by bot."""
+        try:
+            body = method.get_webhook_body()
+        except Exception as exc:
+            self.stats.errors += 1
+            self.report(update, exc)
+            return b''
+        if body is not None:
+            self.stats.replies += 1
+            return body
+        if self.bot is None:
+            self.stats.errors += 1
+            self.report(update, ValueError(f'{method.method_name} with files can\'t be sent in webhook response '
+                                           f'and there is no bot to execute it.'))
+            return b''
+        task = asyncio.ensure_future(self.call(update, method))
+        self._calls.add(task)
+        task.add_done_callback(self._calls.discard)
+        return b''
+
+    async def call(self, update, method):
+        try:
+            await self.bot.execute(method)
+        except Exception as exc:
+            self.stats.errors += 1
+            self.report(update, exc)
+
+    def report(self, update, exc):
+        if self.on_error is not None:
+            self.on_error(update, exc)
+        else:
+            asyncio.get_event_loop().call_exception_handler({
+                'message': f'Webhook handler failed on update {update.update_id}',
+                'exception': exc,
+            })